@@ -1,13 +1,27 @@
-from midil.cli.main import cli
+from typing import TYPE_CHECKING, Any
+
 from midil.version import __service_version__, __version__
 from midil.logger.setup import setup_logger
 from midil.settings import LoggerSettings
 
+if TYPE_CHECKING:
+    from midil.cli.main import cli
+
 
 __all__ = ["cli", "__service_version__", "__version__"]
 
+
+def __getattr__(name: str) -> Any:
+    # The CLI pulls in click, rich and cookiecutter; only import it when the
+    # `midil` console script (or a caller) actually asks for it.
+    if name == "cli":
+        from midil.cli.main import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 logger_settings = LoggerSettings().logger
-print(logger_settings)
 setup_logger(
     level=logger_settings.log_level,
     enable_http_logging=logger_settings.enable_http_logging,
@@ -27,7 +27,22 @@ class CognitoClientCredentialsAuthenticator(AuthNProvider):
         self._lock = asyncio.Lock()
         self.client = get_http_async_client()
 
+        # The token request never changes, so encode it once.
+        basic_auth = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._token_headers = {
+            "Authorization": f"Basic {basic_auth}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        self._token_data = {"grant_type": "client_credentials"}
+        if scope:
+            self._token_data["scope"] = scope
+
     async def get_token(self) -> AuthNToken:
+        # Serve a valid cached token without queueing behind the lock.
+        cached = self._cached_token
+        if cached and not cached.expired:
+            return cached
+
         async with self._lock:
             if self._cached_token and not self._cached_token.expired:
                 return self._cached_token
@@ -39,7 +54,7 @@ class CognitoClientCredentialsAuthenticator(AuthNProvider):
             expires_at_iso = None
             if expires_in_seconds:
                 expires_at = datetime.now(timezone.utc) + timedelta(
-                    seconds=expires_in_seconds
+                    seconds=int(expires_in_seconds)
                 )
                 expires_at_iso = expires_at.isoformat()
 
@@ -57,21 +72,9 @@ class CognitoClientCredentialsAuthenticator(AuthNProvider):
         return AuthNHeaders(**headers)
 
     async def _fetch_token(self) -> Any:
-        credentials = f"{self.client_id}:{self.client_secret}"
-        basic_auth = base64.b64encode(credentials.encode()).decode()
-
-        headers = {
-            "Authorization": f"Basic {basic_auth}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-
-        data = {
-            "grant_type": "client_credentials",
-        }
-        if self.scope:
-            data["scope"] = self.scope
-
-        response = await self.client.post(self.token_url, data=data, headers=headers)
+        response = await self.client.post(
+            self.token_url, data=self._token_data, headers=self._token_headers
+        )
         if response.status_code != 200:
             raise CognitoAuthenticationError(f"Cognito token fetch failed: {response}")
         return response.json()
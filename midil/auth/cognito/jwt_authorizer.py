@@ -1,5 +1,7 @@
 import jwt
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from jwt import PyJWKClient, InvalidTokenError, DecodeError, PyJWK
 from midil.auth.cognito._exceptions import CognitoAuthorizationError
 from midil.auth.exceptions import AuthorizationError
@@ -11,7 +13,7 @@ from midil.auth.interfaces.authorizer import (
     AuthZProvider,
 )
 from midil.auth.interfaces.models import AuthZTokenClaims
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 
 class CognitoTokenClaims(AuthZTokenClaims):
@@ -34,8 +36,7 @@ class CognitoTokenClaims(AuthZTokenClaims):
         default=None, alias="iat", description="The issued at time of the token"
     )
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class CognitoJWTAuthorizer(AuthZProvider):
@@ -45,6 +46,8 @@ class CognitoJWTAuthorizer(AuthZProvider):
 
     _REFRESH_INTERVAL: int = 900  # 15 minutes
     _MAX_CACHE_SIZE: int = 32
+    _VERIFIED_TOKEN_TTL: int = 60
+    _MAX_VERIFIED_TOKENS: int = 10_000
 
     def __init__(
         self, user_pool_id: str, region: str, audience: Optional[str] = None
@@ -60,6 +63,27 @@ class CognitoJWTAuthorizer(AuthZProvider):
             max_cached_keys=self._MAX_CACHE_SIZE,
         )
         self._jwk_client_lock = asyncio.Lock()
+        # Clients resend the same token until it expires, so remember tokens that
+        # already passed verification: token -> (valid until, claims).
+        self._verified: OrderedDict[str, Tuple[float, AuthZTokenClaims]] = OrderedDict()
+
+    def _get_verified(self, token: str) -> Optional[AuthZTokenClaims]:
+        entry = self._verified.get(token)
+        if entry is None:
+            return None
+        valid_until, claims = entry
+        if time.time() >= valid_until:
+            del self._verified[token]
+            return None
+        self._verified.move_to_end(token)
+        return claims
+
+    def _remember_verified(self, token: str, claims: AuthZTokenClaims) -> None:
+        valid_until = min(time.time() + self._VERIFIED_TOKEN_TTL, claims.exp)
+        self._verified[token] = (valid_until, claims)
+        self._verified.move_to_end(token)
+        if len(self._verified) > self._MAX_VERIFIED_TOKENS:
+            self._verified.popitem(last=False)
 
     async def _get_signing_key(self, token: str) -> PyJWK:
         try:
@@ -90,7 +114,14 @@ class CognitoJWTAuthorizer(AuthZProvider):
         Validates and decodes a JWT token using Cognito JWKs.
         Raises CognitoAuthenticationError if invalid.
         Returns the decoded claims.
+
+        Tokens that already passed verification are served from memory for up to
+        `_VERIFIED_TOKEN_TTL` seconds, and never past their own expiry.
         """
+        cached = self._get_verified(token)
+        if cached is not None:
+            return cached
+
         try:
             signing_key = await self._get_signing_key(token)
             decoded = jwt.decode(
@@ -114,6 +145,7 @@ class CognitoJWTAuthorizer(AuthZProvider):
             )
             logger.debug("Successfully verified JWT token", extra={"decoded": decoded})
             claims = CognitoTokenClaims(token=token, **decoded)
+            self._remember_verified(token, claims)
             return claims
 
         except (InvalidTokenError, DecodeError) as e:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, PrivateAttr, Field, ConfigDict
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime, timezone, timedelta
 from dateutil.parser import isoparse
 
@@ -26,9 +26,18 @@ class ExpirableTokenMixin(BaseModel):
 
 class AuthNToken(ExpirableTokenMixin):
     expires_at_iso: Optional[str] = None
+    # `expired` is checked on every request, so keep the parsed expiry around
+    # alongside the string it came from.
+    _parsed_expiry: Optional[Tuple[str, datetime]] = PrivateAttr(default=None)
 
     def expires_at(self) -> Optional[datetime]:
-        return isoparse(self.expires_at_iso) if self.expires_at_iso else None
+        if not self.expires_at_iso:
+            return None
+        parsed = self._parsed_expiry
+        if parsed is None or parsed[0] != self.expires_at_iso:
+            parsed = (self.expires_at_iso, isoparse(self.expires_at_iso))
+            self._parsed_expiry = parsed
+        return parsed[1]
 
 
 class AuthNHeaders(BaseModel):
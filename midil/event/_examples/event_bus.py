@@ -6,6 +6,7 @@ from fastapi import FastAPI
 import uvicorn
 
 from midil.event.event_bus import EventBus
+from midil.utils.concurrency import configure_thread_pool
 from midil.utils.retry import AsyncRetry
 
 bus = EventBus()
@@ -13,6 +14,8 @@ bus = EventBus()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # give sync handlers more threads than the defaults
+    configure_thread_pool()
     # start the event bus
     await bus.start()
     yield
@@ -8,12 +8,16 @@ from loguru import logger
 from midil.event.consumer.strategies.base import ConsumerMessage
 from pydantic import Field
 from botocore.exceptions import ClientError
-from typing import Dict, Any, Optional, Literal, cast
+from typing import Dict, Any, List, Optional, Literal, cast
 import json
 from datetime import datetime
 from midil.utils.retry import AsyncRetry
 from midil.event.utils import get_region_from_sqs_queue_url
-from midil.utils.backoff import ExponentialBackoff
+from midil.utils.backoff import (
+    BackoffStrategy,
+    ExponentialBackoff,
+    ExponentialBackoffWithJitter,
+)
 from midil.event.message import Message
 
 retry_policy = AsyncRetry(retry_on_exceptions=(ClientError,))
@@ -43,6 +47,11 @@ class SQSConsumerEventConfig(PullEventConsumerConfig):
     backoff_max_delay: float = Field(
         default=300, description="Max delay for backoff in seconds", ge=0
     )
+    backoff_jitter: bool = Field(
+        default=True,
+        description="Randomize requeue delays so failed messages don't all become "
+        "visible again at the same moment",
+    )
 
     @property
     def region(self) -> str:
@@ -60,24 +69,44 @@ class SQSConsumer(PullEventConsumer):
     ):
         super().__init__(config)
         self._config: SQSConsumerEventConfig = config
+        # Resolved once; the config properties parse the queue URLs on every access.
+        self._region = config.region
+        self._dlq_region = config.dlq_region
         self.session = aioboto3.Session()
-        self.backoff = ExponentialBackoff(
-            base_delay=self._config.backoff_base_delay,
-            max_delay=self._config.backoff_max_delay,
+        self.backoff: BackoffStrategy = (
+            ExponentialBackoffWithJitter(
+                base=self._config.backoff_base_delay,
+                cap=self._config.backoff_max_delay,
+            )
+            if self._config.backoff_jitter
+            else ExponentialBackoff(
+                base_delay=self._config.backoff_base_delay,
+                max_delay=self._config.backoff_max_delay,
+            )
         )
+        # Messages acked while a received batch is being dispatched. Each handler
+        # flushes them with one DeleteMessageBatch call as soon as it completes, so
+        # acks from handlers finishing together share a request while a slow
+        # handler never holds back the deletes of the others.
+        self._pending_acks: Optional[List[ConsumerMessage]] = None
 
     async def ack(self, message: Message) -> None:
         """
         Acknowledge (delete) the message from the SQS queue.
 
+        While a polled batch is being dispatched, the delete is deferred until the
+        handler completes and sent via `_flush_acks`, together with any other
+        messages acked by then.
+
         Args:
             message (EventContext): The SQS message dictionary, expected to contain 'ReceiptHandle'.
         """
         message = cast(ConsumerMessage, message)
+        if self._pending_acks is not None:
+            self._pending_acks.append(message)
+            return
         try:
-            async with self.session.client(
-                "sqs", region_name=self._config.region
-            ) as sqs:
+            async with self.session.client("sqs", region_name=self._region) as sqs:
                 await sqs.delete_message(
                     QueueUrl=self._config.queue_url,
                     ReceiptHandle=message.ack_handle,
@@ -108,7 +137,7 @@ class SQSConsumer(PullEventConsumer):
             if requeue and self._config.dlq_url:
                 # move to dead letter queue
                 async with self.session.client(
-                    "sqs", region_name=self._config.dlq_region
+                    "sqs", region_name=self._dlq_region
                 ) as sqs:
                     params = {
                         "QueueUrl": self._config.dlq_url,
@@ -130,13 +159,12 @@ class SQSConsumer(PullEventConsumer):
                     logger.debug(f"Sent message {message.id} to DLQ")
 
             else:
-                async with self.session.client(
-                    "sqs", region_name=self._config.region
-                ) as sqs:
+                async with self.session.client("sqs", region_name=self._region) as sqs:
                     receive_count = int(
                         message.metadata.get("ApproximateReceiveCount", "1")
                     )
-                    delay = self.backoff.next_delay(receive_count)
+                    # VisibilityTimeout must be a whole number of seconds.
+                    delay = round(self.backoff.next_delay(receive_count))
                     await sqs.change_message_visibility(
                         QueueUrl=self._config.queue_url,
                         ReceiptHandle=message.ack_handle,
@@ -154,7 +182,7 @@ class SQSConsumer(PullEventConsumer):
         """
         Main loop for polling SQS and processing messages.
         """
-        async with self.session.client("sqs", region_name=self._config.region) as sqs:
+        async with self.session.client("sqs", region_name=self._region) as sqs:
             while self._running:
                 logger.debug(
                     f"Polling SQS for new messages from queue: {self._config.queue_url}"
@@ -173,9 +201,14 @@ class SQSConsumer(PullEventConsumer):
                         logger.debug(
                             f"Found {len(messages)} message(s), dispatching..."
                         )
-                        async with asyncio.TaskGroup() as tg:
-                            for msg in messages:
-                                tg.create_task(self._process_message(msg))
+                        self._pending_acks = []
+                        try:
+                            async with asyncio.TaskGroup() as tg:
+                                for msg in messages:
+                                    tg.create_task(self._process_and_ack(sqs, msg))
+                        finally:
+                            await self._flush_acks(sqs)
+                            self._pending_acks = None
                     else:
                         await asyncio.sleep(self._config.poll_interval)
                 except ClientError as e:
@@ -184,6 +217,44 @@ class SQSConsumer(PullEventConsumer):
                     )
                     raise e
 
+    async def _process_and_ack(self, sqs: Any, message: Dict[str, Any]) -> None:
+        try:
+            await self._process_message(message)
+        finally:
+            await self._flush_acks(sqs)
+
+    async def _flush_acks(self, sqs: Any) -> None:
+        """
+        Delete the messages acked so far in the current batch in a single request.
+
+        A batch never holds more than `max_number_of_messages` (<= 10) messages,
+        which is within the DeleteMessageBatch entry limit. Errors are logged
+        rather than raised: this runs in `finally` blocks, where raising would
+        mask the handler's own exception.
+        """
+        if not self._pending_acks:
+            return
+        pending, self._pending_acks = self._pending_acks, []
+        try:
+            response = await sqs.delete_message_batch(
+                QueueUrl=self._config.queue_url,
+                Entries=[
+                    {"Id": str(index), "ReceiptHandle": message.ack_handle}
+                    for index, message in enumerate(pending)
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Error acknowledging {len(pending)} message(s): {e}")
+            return
+
+        failed = response.get("Failed", [])
+        for failure in failed:
+            message = pending[int(failure["Id"])]
+            logger.error(
+                f"Error acknowledging message {message.id}: {failure.get('Message')}"
+            )
+        logger.debug(f"Acknowledged {len(pending) - len(failed)} message(s)")
+
     async def _process_message(self, message: Dict[str, Any]) -> None:
         """
         Parse and dispatch a single message to subscribers.
@@ -1,10 +1,12 @@
 import contextvars
+import random
 from contextlib import asynccontextmanager
-from uuid import uuid4
-from typing import Optional, AsyncGenerator, Union, Final, cast
+from typing import Callable, Optional, AsyncGenerator, Union, Final, cast
 
 
 class EventContext:
+    __slots__ = ("id", "event_type", "parent")
+
     def __init__(
         self,
         id: str,
@@ -25,6 +27,21 @@ class EventContext:
 # Sentinel to distinguish between "not provided" and "explicit None"
 NOTSET: Final = object()
 
+
+def _default_id() -> str:
+    """
+    Generate a 32 character hex event ID.
+
+    Event IDs only need to be unique, not unguessable, so this draws from
+    `random` instead of paying for the `os.urandom` syscall behind `uuid4`.
+    """
+    return f"{random.getrandbits(128):032x}"
+
+
+# Hook used to generate IDs for new event contexts. Replace it (for example with
+# `lambda: uuid4().hex`) if callers need real UUIDs.
+id_factory: Callable[[], str] = _default_id
+
 # Context variable to hold the current EventContext
 _current_event_context: contextvars.ContextVar[EventContext] = contextvars.ContextVar(
     "event"
@@ -65,7 +82,7 @@ async def event_context(
         parent = cast(Optional[EventContext], parent_override)
 
     new_context = EventContext(
-        id=id or uuid4().hex,
+        id=id or id_factory(),
         event_type=event_type,
         parent=parent,
     )
@@ -1,5 +1,7 @@
-from typing import Any, Dict, Optional, Mapping
-from pydantic_settings import BaseSettings
+import asyncio
+from typing import Any, Callable, Dict, NamedTuple, Optional, Mapping, Type
+from pydantic import BaseModel
+from loguru import logger
 
 from midil.event.consumer.strategies.pull import PullEventConsumer
 from midil.event.consumer.strategies.push import PushEventConsumer
@@ -32,14 +34,40 @@ from midil.event.config import (
 )
 
 
+# Transport classes are called with their own config type, so they are typed as
+# constructors taking any config rather than as subclasses of the base classes.
+_ProducerFactory = Callable[[Any], EventProducer]
+_ConsumerFactory = Callable[[Any], PullEventConsumer | PushEventConsumer]
+
+
+class _Transport(NamedTuple):
+    producer: Optional[_ProducerFactory]
+    producer_config: Optional[Type[BaseModel]]
+    consumer: Optional[_ConsumerFactory]
+    consumer_config: Optional[Type[BaseModel]]
+
+    @property
+    def config(self) -> Optional[Type[BaseModel]]:
+        """The config built by `create_config`: the producer's, else the consumer's."""
+        return self.producer_config or self.consumer_config
+
+
+_NO_TRANSPORT = _Transport(None, None, None, None)
+
+
 class EventBusFactory:
     """
     Factory class for creating event producers, consumers, and their configurations.
 
     Class Attributes:
-        PRODUCER_MAP: Maps producer type strings to their corresponding producer classes.
-        CONSUMER_MAP: Maps consumer type strings to their corresponding consumer classes.
-        CONFIG_MAP: Maps transport types to their configuration classes for both producer and consumer.
+        _TRANSPORTS: Maps each transport type string to a `_Transport` entry holding its
+            producer and consumer classes and their configuration classes (None where
+            the transport does not support that role). This is the only place a
+            transport is registered.
+        _PRODUCERS_BY_CONFIG / _CONSUMERS_BY_CONFIG: Derived from `_TRANSPORTS`; map
+            each configuration class to the class it creates, so the factory can
+            dispatch on `type(config)` and only fall back to `config.type` for other
+            configs.
 
     Methods:
         create_producer: Instantiates an EventProducer based on the provided configuration.
@@ -47,20 +75,22 @@ class EventBusFactory:
         create_config: Instantiates a configuration object for a given transport type.
     """
 
-    _PRODUCER_MAP = {
-        "redis": RedisProducer,
-        "sqs": SQSProducer,
+    _TRANSPORTS: Dict[str, _Transport] = {
+        "redis": _Transport(RedisProducer, RedisProducerEventConfig, None, None),
+        "sqs": _Transport(
+            SQSProducer, SQSProducerEventConfig, SQSConsumer, SQSConsumerEventConfig
+        ),
+        "webhook": _Transport(None, None, WebhookConsumer, WebhookConsumerEventConfig),
     }
-    _CONSUMER_MAP = {
-        "sqs": SQSConsumer,
-        "webhook": WebhookConsumer,
+    _PRODUCERS_BY_CONFIG: Dict[Type[BaseModel], _ProducerFactory] = {
+        transport.producer_config: transport.producer
+        for transport in _TRANSPORTS.values()
+        if transport.producer is not None and transport.producer_config is not None
     }
-    _CONFIG_MAP = {
-        "sqs": {"producer": SQSProducerEventConfig, "consumer": SQSConsumerEventConfig},
-        "webhook": {
-            "consumer": WebhookConsumerEventConfig,
-        },
-        "redis": {"producer": RedisProducerEventConfig},
+    _CONSUMERS_BY_CONFIG: Dict[Type[BaseModel], _ConsumerFactory] = {
+        transport.consumer_config: transport.consumer
+        for transport in _TRANSPORTS.values()
+        if transport.consumer is not None and transport.consumer_config is not None
     }
 
     @classmethod
@@ -77,8 +107,10 @@ class EventBusFactory:
         Raises:
             ValueError: If the producer type is not supported.
         """
-        producer_cls = cls._PRODUCER_MAP.get(config.type)
-        if not producer_cls:
+        producer_cls = cls._PRODUCERS_BY_CONFIG.get(type(config))
+        if producer_cls is None:
+            producer_cls = cls._TRANSPORTS.get(config.type, _NO_TRANSPORT).producer
+        if producer_cls is None:
             raise ProducerNotImplementedError(config.type)
         return producer_cls(config)
 
@@ -99,15 +131,17 @@ class EventBusFactory:
             ValueError: If the consumer type is not supported.
         """
 
-        consumer_cls = cls._CONSUMER_MAP.get(config.type)
-        if not consumer_cls:
+        consumer_cls = cls._CONSUMERS_BY_CONFIG.get(type(config))
+        if consumer_cls is None:
+            consumer_cls = cls._TRANSPORTS.get(config.type, _NO_TRANSPORT).consumer
+        if consumer_cls is None:
             raise ConsumerNotImplementedError(config.type)
         return consumer_cls(config)
 
     @classmethod
     def create_config(
         cls, transport: EventProducerType | EventConsumerType, **kwargs
-    ) -> BaseSettings:
+    ) -> BaseModel:
         """
         Create a configuration object for the specified transport type.
 
@@ -116,16 +150,13 @@ class EventBusFactory:
             **kwargs: Additional keyword arguments to pass to the config class.
 
         Returns:
-            An instance of a configuration class derived from BaseSettings.
+            An instance of the transport's configuration model.
 
         Raises:
-            ValueError: If the transport type is not supported.
+            TransportNotImplementedError: If the transport type is not supported.
         """
-        config_map = cls._CONFIG_MAP.get(transport)
-        if not isinstance(config_map, dict):
-            raise TransportNotImplementedError(transport)
-        config_cls = config_map.get("producer") or config_map.get("consumer")
-        if not config_cls:
+        config_cls = cls._TRANSPORTS.get(transport, _NO_TRANSPORT).config
+        if config_cls is None:
             raise TransportNotImplementedError(transport)
         return config_cls(**kwargs)
 
@@ -136,8 +167,8 @@ class EventBus:
     subscribe handlers, and manage the lifecycle of event producers and consumers.
 
     Attributes:
-        producer: The event producer instance, if configured.
-        consumers: Dictionary of named consumer instances, if configured.
+        producers: Dictionary of named producer instances (empty if none are configured).
+        consumers: Dictionary of named consumer instances (empty if none are configured).
 
     Methods:
         publish: Publish an event to the configured producer.
@@ -158,23 +189,11 @@ class EventBus:
             config: An EventBusConfig instance specifying producer and/or consumer configurations.
         """
         if config is None:
-            from midil.settings import (
-                list_available_consumers,
-                get_consumer_event_settings,
-                get_producer_event_settings,
-                list_available_producers,
-            )
+            # The settings are parsed from the environment once and cached, so
+            # reuse that EventConfig instead of rebuilding one from its entries.
+            from midil.settings import get_event_settings
 
-            consumers = list_available_consumers()
-            producers = list_available_producers()
-            config = EventConfig(
-                consumers={
-                    name: get_consumer_event_settings(name) for name in consumers.keys()
-                },
-                producers={
-                    name: get_producer_event_settings(name) for name in producers.keys()
-                },
-            )
+            config = get_event_settings()
 
         self.producers: Mapping[str, EventProducer] = {}
         if config.producers:
@@ -204,18 +223,20 @@ class EventBus:
         Raises:
             ValueError: If no producers are configured or if the specified producer is not found.
         """
-        if not self.producers:
+        producers = self.producers
+        if not producers:
             raise ValueError("No producers configured")
 
         if target:
-            if target not in self.producers:
-                available_producers = list(self.producers.keys())
+            producer = producers.get(target)
+            if producer is None:
+                available_producers = list(producers.keys())
                 raise ValueError(
                     f"Producer '{target}' not found. Available producers: {available_producers}"
                 )
-            await self.producers[target].publish(payload, metadata=metadata)
+            await producer.publish(payload, metadata=metadata)
         else:
-            for producer in self.producers.values():
+            for producer in producers.values():
                 await producer.publish(payload, metadata=metadata)
 
     def subscribe(self, handler: EventSubscriber, target: Optional[str] = None) -> None:
@@ -288,9 +309,22 @@ class EventBus:
     async def stop(self) -> None:
         """
         Stop all event consumers and close the event producer, performing any necessary cleanup.
-        """
-        for _, consumer in self.consumers.items():
-            await consumer.stop()
 
-        for _, producer in self.producers.items():
-            await producer.close()
+        Consumers are stopped first, so handlers still running can publish, and the
+        producers are closed once they are done. Within each group shutdowns run
+        concurrently. Every one of them is given the chance to shut down; the first
+        error, if any, is re-raised afterwards.
+        """
+        results = await asyncio.gather(
+            *(consumer.stop() for consumer in self.consumers.values()),
+            return_exceptions=True,
+        )
+        results += await asyncio.gather(
+            *(producer.close() for producer in self.producers.values()),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            logger.error(f"Error stopping event bus: {error}")
+        if errors:
+            raise errors[0]
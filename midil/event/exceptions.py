@@ -1,7 +1,4 @@
-from abc import ABC
-
-
-class BaseEventError(Exception, ABC):
+class BaseEventError(Exception):
     """
     Base class for all errors.
     """
@@ -1,7 +1,12 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
 
+from loguru import logger
 from pydantic import BaseModel, Field
+from midil.event.exceptions import ProducerError
 from midil.event.message import MessageBody
+from midil.event.utils import dumps_message
 
 
 class BaseProducerConfig(BaseModel):
@@ -54,3 +59,113 @@ class EventProducer(ABC):
         to publish further events.
         """
         pass
+
+
+PendingMessage = Tuple[bytes, "asyncio.Future[None]"]
+
+# Queued by close() to tell the flusher to send what it has and stop.
+_CLOSE: Any = object()
+
+
+class BatchingEventProducer(EventProducer):
+    """
+    Base class for producers that coalesce concurrent `publish` calls.
+
+    Messages are queued and a background flusher hands them to `_flush` in
+    batches of up to `max_batch_size`, so N publishers pay one round-trip instead
+    of N. Each `publish` call still waits for its own message and re-raises the
+    error `_flush` sets on its future.
+
+    Subclasses implement `_flush` and call `_drain` from `close` before releasing
+    their connections.
+    """
+
+    close_timeout: float = 10.0
+
+    def __init__(self, *, max_batch_size: int, linger_ms: float = 0.0) -> None:
+        self._max_batch_size = max_batch_size
+        self._linger = linger_ms / 1000
+        self._queue: asyncio.Queue[PendingMessage] = asyncio.Queue()
+        self._flusher: Optional[asyncio.Task[None]] = None
+
+    @abstractmethod
+    async def _flush(self, batch: List[PendingMessage]) -> None:
+        """
+        Send a batch and resolve each message's future.
+
+        If the send is cancelled the futures must be cancelled too, so no
+        publisher is left waiting.
+        """
+
+    async def publish(self, payload: MessageBody, **kwargs) -> None:
+        message = dumps_message(payload)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        await future
+
+    async def _flush_loop(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            # Give concurrent publishers a chance to enqueue before flushing.
+            try:
+                await asyncio.sleep(self._linger)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            closing = False
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if closing:
+                return
+
+    async def _drain(self) -> None:
+        """
+        Send everything queued so far and stop the flusher.
+
+        The flusher is given `close_timeout` seconds to finish; if the backend
+        hangs it is cancelled and messages still queued are failed instead of
+        being sent to the same backend again.
+        """
+        timed_out = False
+        if self._flusher is not None and not self._flusher.done():
+            self._queue.put_nowait(_CLOSE)
+            try:
+                await asyncio.wait_for(self._flusher, self.close_timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                logger.warning(
+                    f"Timed out after {self.close_timeout}s flushing pending messages"
+                )
+        self._flusher = None
+
+        # Messages queued but not yet picked up by the flusher.
+        pending: List[PendingMessage] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _CLOSE:
+                pending.append(item)
+        if not pending:
+            return
+        if timed_out:
+            error = ProducerError("Producer closed before the message was sent")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        try:
+            await asyncio.wait_for(self._flush(pending), self.close_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timed out after {self.close_timeout}s flushing pending messages"
+            )
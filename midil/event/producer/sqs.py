@@ -1,31 +1,130 @@
-from midil.event.producer.base import EventProducer
+from midil.event.producer.base import BatchingEventProducer, PendingMessage
 from midil.event.producer.base import BaseProducerConfig
+from midil.event.exceptions import ProducerError
 import aioboto3
-from typing import Literal
-import json
+import asyncio
+from typing import Any, List, Literal, Optional
 from pydantic import Field
 from midil.event.utils import get_region_from_sqs_queue_url
-from midil.event.message import MessageBody
+
+# SendMessageBatch limits: at most 10 entries and 256 KiB of message bodies.
+_MAX_BATCH_ENTRIES = 10
+_MAX_BATCH_BYTES = 256 * 1024
+
+_session: Optional[aioboto3.Session] = None
+
+
+def _get_session() -> aioboto3.Session:
+    """Return the aioboto3 session shared by all SQS producers."""
+    global _session
+    if _session is None:
+        _session = aioboto3.Session()
+    return _session
 
 
 class SQSProducerEventConfig(BaseProducerConfig):
     type: Literal["sqs"] = "sqs"
     queue_url: str = Field(..., description="URL of the queue")
+    linger_ms: float = Field(
+        default=0.0,
+        description="Time to wait for more messages before flushing a batch "
+        "(0 flushes on the next event-loop tick)",
+        ge=0.0,
+    )
 
     @property
     def region(self) -> str:
         return get_region_from_sqs_queue_url(self.queue_url)
 
 
-class SQSProducer(EventProducer):
+class SQSProducer(BatchingEventProducer):
+    """
+    Publishes events to an SQS queue.
+
+    Concurrent `publish` calls are queued and sent by a background flusher with
+    `SendMessageBatch`, up to 10 messages per request. Each `publish` call still
+    waits for its own message and raises if SQS rejects it.
+    """
+
     def __init__(self, config: SQSProducerEventConfig):
-        self.session = aioboto3.Session()
+        super().__init__(max_batch_size=_MAX_BATCH_ENTRIES, linger_ms=config.linger_ms)
+        self.session = _get_session()
         self.config = config
+        # Resolved once; `region` parses the queue URL on every access.
+        self._queue_url = config.queue_url
+        self._region = config.region
+        # The SQS client is created on first publish and reused until close().
+        self._client_cm: Optional[Any] = None
+        self._client: Optional[Any] = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self) -> Any:
+        if self._client is not None:
+            return self._client
+        async with self._client_lock:
+            if self._client is None:
+                client_cm = self.session.client("sqs", region_name=self._region)
+                self._client = await client_cm.__aenter__()
+                self._client_cm = client_cm
+        return self._client
+
+    async def _flush(self, batch: List[PendingMessage]) -> None:
+        # Split on the request size limit; a single oversized message is still
+        # sent on its own so SQS reports the error for it.
+        chunk: List[PendingMessage] = []
+        size = 0
+        try:
+            for item in batch:
+                message_size = len(item[0])
+                if chunk and size + message_size > _MAX_BATCH_BYTES:
+                    await self._send_batch(chunk)
+                    chunk, size = [], 0
+                chunk.append(item)
+                size += message_size
+            if chunk:
+                await self._send_batch(chunk)
+        except asyncio.CancelledError:
+            # Chunks not sent yet must not leave their publishers waiting.
+            for _, future in batch:
+                future.cancel()
+            raise
 
-    async def publish(self, payload: MessageBody, **kwargs) -> None:
-        message = json.dumps(payload)
-        async with self.session.client("sqs", region_name=self.config.region) as sqs:
-            await sqs.send_message(QueueUrl=self.config.queue_url, MessageBody=message)
+    async def _send_batch(self, batch: List[PendingMessage]) -> None:
+        try:
+            sqs = await self._get_client()
+            response = await sqs.send_message_batch(
+                QueueUrl=self._queue_url,
+                Entries=[
+                    {"Id": str(index), "MessageBody": message.decode("utf-8")}
+                    for index, (message, _) in enumerate(batch)
+                ],
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for failure in response.get("Failed", []):
+            _, future = batch[int(failure["Id"])]
+            if not future.done():
+                future.set_exception(
+                    ProducerError(
+                        f"Failed to publish message to {self._queue_url}: "
+                        f"{failure.get('Code')}: {failure.get('Message')}"
+                    )
+                )
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
 
     async def close(self) -> None:
-        pass
+        await self._drain()
+
+        if self._client_cm is not None:
+            client_cm, self._client_cm, self._client = self._client_cm, None, None
+            await client_cm.__aexit__(None, None, None)
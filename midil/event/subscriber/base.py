@@ -1,5 +1,8 @@
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from typing import Any, Awaitable, Callable, Optional
+import anyio.to_thread
 from midil.event.message import Message
 
 
@@ -161,15 +164,14 @@ class FunctionSubscriber(EventSubscriber):
     ):
         self.handler = handler
         self.middlewares = middlewares or []
+        self._chain = self._build_chain()
 
-    async def handle(self, event: Message) -> None:
+    def _build_chain(self) -> Callable[[Message], Awaitable[Any]]:
         """
-        Handle an event by applying all middlewares to the handler.
-
-        Args:
-            event: The event to process.
+        Compose the handler with all middlewares once, at registration time,
+        so dispatching an event does not rebuild the wrapper closures.
         """
-        next_handler = self.handler
+        next_handler = self._as_async(self.handler)
         # Apply middlewares in reverse order (so the first is the outermost)
         for mw in reversed(self.middlewares):
 
@@ -177,4 +179,35 @@ class FunctionSubscriber(EventSubscriber):
                 return await m(e, h)
 
             next_handler = wrapped
-        await next_handler(event)
+        return next_handler
+
+    @staticmethod
+    def _as_async(handler: Callable[..., Any]) -> Callable[[Message], Awaitable[Any]]:
+        """
+        Return `handler` as a coroutine function, deciding once whether it is async.
+
+        Sync handlers run in the threadpool; if one returns an awaitable (e.g. a
+        lambda wrapping an async function) it is awaited on the event loop.
+        """
+        if asyncio.iscoroutinefunction(handler) or asyncio.iscoroutinefunction(
+            getattr(handler, "__call__", None)
+        ):
+            return handler
+
+        async def call_sync(event: Message) -> Any:
+            # run_sync takes positional args, so no partial is built per event.
+            result = await anyio.to_thread.run_sync(handler, event)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return call_sync
+
+    async def handle(self, event: Message) -> None:
+        """
+        Handle an event by applying all middlewares to the handler.
+
+        Args:
+            event: The event to process.
+        """
+        await self._chain(event)
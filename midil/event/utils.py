@@ -1,6 +1,13 @@
+import json
+from typing import Any
 from urllib.parse import urlparse
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 def get_region_from_sqs_queue_url(queue_url: str) -> str:
     try:
@@ -12,3 +19,26 @@ def get_region_from_sqs_queue_url(queue_url: str) -> str:
     except Exception as e:
         logger.error(f"Could not extract region from queue url: {e}")
         raise ValueError(f"Invalid SQS queue url: {queue_url}") from e
+
+
+def dumps_message(payload: Any) -> bytes:
+    """
+    Serialize a message body to compact UTF-8 JSON.
+
+    Uses orjson (the ``speedups`` extra) when it is installed. Payloads orjson
+    rejects, such as integers beyond 64 bits or datetimes, go through the standard
+    library instead, so they are encoded (or rejected) exactly as ``json.dumps``
+    would. orjson does encode a few types the standard library refuses, such as
+    UUIDs and dataclasses.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            pass
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
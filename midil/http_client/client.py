@@ -26,8 +26,6 @@ class HttpClient:
     @property
     def client(self) -> httpx.AsyncClient:
         """Get the HTTP client."""
-        print("Getting client", self._client.base_url)
-        print("Getting client base url", self._client.headers)
         return self._client
 
     @client.setter
@@ -1,48 +1,77 @@
+import asyncio
+import weakref
+from collections import OrderedDict
+
 import httpx
-import contextvars
-import hashlib
-import json
 
 from midil.http_client.overrides.async_client import MidilAsyncClient
 from midil.http_client.overrides.retry.transport import RetryTransport
 
-from typing import Any
-
+from typing import Any, Hashable, Optional, Tuple
 
-_http_client_var: contextvars.ContextVar[
-    httpx.AsyncClient | None
-] = contextvars.ContextVar("_http_client_var", default=None)
 
-_client_params_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
-    "_client_params_var", default=None
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
 )
 
+# Only options made of these (and URLs, keyed by their string form) are cached:
+# objects such as auth flows, transports or event hooks have no stable identity
+# to key on.
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+_MAX_CLIENTS_PER_LOOP = 32
 
-def _get_http_client_context(timeout: int = 60, **kwargs: Any) -> httpx.AsyncClient:
-    params: dict[str, Any] = {"timeout": timeout}
-    for key, value in kwargs.items():
-        if hasattr(value, "__str__") and "URL" in str(type(value)):
-            params[key] = str(value)
-        else:
-            params[key] = value
+_ClientCache = OrderedDict[Hashable, httpx.AsyncClient]
 
-    params_hash = hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest()
+# One client per set of client options, shared by every caller and task, so
+# they all draw from the same connection pool. Pools can't be used across event
+# loops, so the cache is split per running loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientCache]" = (
+    weakref.WeakKeyDictionary()
+)
 
-    cached_params = _client_params_var.get()
-    client = _http_client_var.get()
 
-    if client is not None and cached_params == params_hash:
-        return client
+def _cache_key(timeout: int, kwargs: dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    items = []
+    for name, value in kwargs.items():
+        if isinstance(value, httpx.URL):
+            value = str(value)
+        elif not isinstance(value, _CACHEABLE_TYPES):
+            return None
+        items.append((name, value))
+    return (timeout, *sorted(items))
 
-    client = MidilAsyncClient(
+
+def _new_client(timeout: int, **kwargs: Any) -> httpx.AsyncClient:
+    kwargs.setdefault("limits", _DEFAULT_LIMITS)
+    return MidilAsyncClient(
         transport_class=RetryTransport,
         timeout=timeout,
         **kwargs,
     )
 
-    _http_client_var.set(client)
-    _client_params_var.set(params_hash)
 
+def _get_http_client_context(timeout: int = 60, **kwargs: Any) -> httpx.AsyncClient:
+    key = _cache_key(timeout, kwargs)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if key is None or loop is None:
+        return _new_client(timeout, **kwargs)
+
+    clients = _clients.get(loop)
+    if clients is None:
+        clients = _clients[loop] = OrderedDict()
+    client = clients.get(key)
+    if client is not None and not client.is_closed:
+        clients.move_to_end(key)
+        return client
+
+    client = clients[key] = _new_client(timeout, **kwargs)
+    while len(clients) > _MAX_CLIENTS_PER_LOOP:
+        # Evicted clients are only forgotten, not closed: whoever was handed one
+        # may still hold on to it and keep using it.
+        clients.popitem(last=False)
     return client
 
 
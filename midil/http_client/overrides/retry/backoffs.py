@@ -5,7 +5,7 @@ from dateutil.parser import isoparse
 from midil.utils.backoff import BackoffStrategy, ExponentialBackoffWithJitter
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackoffConfig:
     base_delay: float = 0.1  # starting delay in seconds
     max_delay: float = 60.0  # max cap in seconds
@@ -15,6 +15,8 @@ class BackoffConfig:
 
 
 class ExponentialBackoffAdaptor(BackoffStrategy):
+    __slots__ = ("config", "strategy")
+
     def __init__(
         self,
         strategy: BackoffStrategy | None = None,
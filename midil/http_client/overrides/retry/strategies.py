@@ -7,9 +7,12 @@ class DefaultRetryStrategy:
     RETRYABLE_METHODS = frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"])
     RETRYABLE_STATUS_CODES = frozenset([429, 502, 503, 504, 401, 400])
 
+    __slots__ = ("retryable_methods", "retryable_status_codes")
+
     def __init__(self, retryable_methods=None, retryable_status_codes=None):
-        self.retryable_methods = retryable_methods or self.RETRYABLE_METHODS
-        self.retryable_status_codes = (
+        # Accept any iterable but store frozensets so lookups stay O(1).
+        self.retryable_methods = frozenset(retryable_methods or self.RETRYABLE_METHODS)
+        self.retryable_status_codes = frozenset(
             retryable_status_codes or self.RETRYABLE_STATUS_CODES
         )
 
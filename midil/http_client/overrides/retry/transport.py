@@ -58,16 +58,22 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
     ) -> httpx.Response:
         response = None
         for attempt in range(1, self._max_attempts + 1):
+            is_last_attempt = attempt == self._max_attempts
             error = None
             try:
                 response = send(request)
-                if not self._retry_strategy.should_retry(request, response, None):
+                if is_last_attempt or not self._retry_strategy.should_retry(
+                    request, response, None
+                ):
                     return response
                 response.close()
             except Exception as exc:
-                error = exc
-                if not self._retry_strategy.should_retry(request, None, exc):
+                if is_last_attempt or not self._retry_strategy.should_retry(
+                    request, None, exc
+                ):
                     raise
+                error = exc
+                response = None
             msg = f"Retry {attempt} for {request.method} {request.url}"
             if error:
                 logger.warning(f"{msg} due to error: {error}")
@@ -79,7 +85,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 )
             )
             request = self._observer.on_retry(request) if self._observer else request
-        return response  # type: ignore # May be failed last attempt
+        return response  # type: ignore # Only reached when max_attempts < 1
 
     async def _async_retry_loop(
         self,
@@ -88,16 +94,22 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
     ) -> httpx.Response:
         response = None
         for attempt in range(1, self._max_attempts + 1):
+            is_last_attempt = attempt == self._max_attempts
             error = None
             try:
                 response = await send(request)
-                if not self._retry_strategy.should_retry(request, response, None):
+                if is_last_attempt or not self._retry_strategy.should_retry(
+                    request, response, None
+                ):
                     return response
                 await response.aclose()
             except Exception as exc:
-                error = exc
-                if not self._retry_strategy.should_retry(request, None, exc):
+                if is_last_attempt or not self._retry_strategy.should_retry(
+                    request, None, exc
+                ):
                     raise
+                error = exc
+                response = None
             msg = f"Retry {attempt} for {request.method} {request.url}"
             if error:
                 logger.warning(f"{msg} due to error: {error}")
@@ -109,7 +121,7 @@ class RetryTransport(httpx.AsyncBaseTransport, httpx.BaseTransport):
                 )
             )
             request = self._observer.on_retry(request) if self._observer else request
-        return response  # type: ignore # Final failed attempt
+        return response  # type: ignore # Only reached when max_attempts < 1
 
     async def aclose(self) -> None:
         await self._wrapped.aclose()  # type: ignore
@@ -3,6 +3,7 @@ from midil.jsonapi.document import (
     Document,
     ErrorObject,
     Header,
+    JSONAPI_DEFAULT_HEADERS,
     Links,
     ResourceIdentifierObject,
     RelationshipObject,
@@ -13,6 +14,7 @@ from midil.jsonapi.document import (
     PostDocument,
     PatchDocument,
     ErrorDocument,
+    warmup_jsonapi,
 )
 from midil.jsonapi.query import (
     QueryParams,
@@ -26,6 +28,7 @@ from midil.jsonapi.query import (
 
 __all__ = [
     "Header",
+    "JSONAPI_DEFAULT_HEADERS",
     "Document",
     "ErrorObject",
     "ErrorSource",
@@ -45,4 +48,5 @@ __all__ = [
     "SortDirection",
     "SortField",
     "ErrorDocument",
+    "warmup_jsonapi",
 ]
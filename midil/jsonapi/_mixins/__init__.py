@@ -1,3 +1,4 @@
+from midil.jsonapi._mixins.constructors import TrustedConstructorMixin
 from midil.jsonapi._mixins.serializers import (
     DocumentSerializerMixin,
     ErrorSerializerMixin,
@@ -16,4 +17,5 @@ __all__ = [
     "ErrorSourceValidatorMixin",
     "ResourceIdentifierValidatorMixin",
     "ResourceValidatorMixin",
+    "TrustedConstructorMixin",
 ]
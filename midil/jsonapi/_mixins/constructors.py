@@ -0,0 +1,112 @@
+import types
+from collections.abc import Mapping as MappingABC
+from typing import (
+    Annotated,
+    Any,
+    Mapping,
+    Self,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_UNION_TYPES = (Union, types.UnionType)
+_LIST_TYPES = (list, tuple)
+
+
+def construct_trusted(model: Type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """
+    Build `model` from already-validated data without running pydantic validation.
+
+    Nested models declared in the field annotations are built the same way, so a
+    whole document tree is constructed with `model_construct`.
+    """
+    if not model.__pydantic_complete__:
+        # Models with forward references are normally completed on first
+        # validation, which this path never triggers.
+        model.model_rebuild()
+    values = {}
+    for name, field in model.model_fields.items():
+        key = name if name in data else field.alias
+        if key is not None and key in data:
+            values[name] = _construct_value(field.annotation, data[key])
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if value is None or isinstance(value, BaseModel):
+        return value
+
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _construct_value(get_args(annotation)[0], value)
+
+    if origin in _UNION_TYPES:
+        for arg in get_args(annotation):
+            if _accepts(arg, value):
+                return _construct_value(arg, value)
+        return value
+
+    if origin in _LIST_TYPES:
+        (item_annotation, *_) = get_args(annotation) or (Any,)
+        return [_construct_value(item_annotation, item) for item in value]
+
+    if origin is MappingABC or origin is dict:
+        args = get_args(annotation)
+        value_annotation = args[1] if len(args) == 2 else Any
+        return {k: _construct_value(value_annotation, v) for k, v in value.items()}
+
+    if _is_model(annotation) and isinstance(value, MappingABC):
+        return construct_trusted(annotation, value)
+
+    return value
+
+
+def _accepts(annotation: Any, value: Any) -> bool:
+    """Whether a union member is the branch `value` was produced from."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _accepts(get_args(annotation)[0], value)
+    if origin in _UNION_TYPES:
+        return any(_accepts(arg, value) for arg in get_args(annotation))
+    if origin in _LIST_TYPES:
+        return isinstance(value, list)
+    if origin is MappingABC or origin is dict:
+        return isinstance(value, MappingABC)
+    if _is_model(annotation):
+        return isinstance(value, MappingABC)
+    if isinstance(annotation, type):
+        return isinstance(value, annotation)
+    return False
+
+
+def _is_model(annotation: Any) -> bool:
+    # A bare `BaseModel` (e.g. `BaseModel | Mapping` attributes) names no concrete
+    # fields, so there is nothing to construct.
+    return (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and annotation is not BaseModel
+    )
+
+
+class TrustedConstructorMixin:
+    @classmethod
+    def construct_trusted(cls, **data: Any) -> Self:
+        """
+        Build the model, and every nested model, without validation.
+
+        Only for data that is already known to be valid, such as rows loaded from
+        the database or documents produced by this service. Nothing is checked:
+        the id/type patterns, required fields and model validators are all
+        skipped. Use the regular constructor or `model_validate` for request bodies
+        and anything else coming from outside.
+        """
+        return construct_trusted(cls, data)  # type: ignore[type-var]
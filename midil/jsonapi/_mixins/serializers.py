@@ -93,6 +93,11 @@ class DocumentSerializerMixin:
         self._add_included(result)
         return result
 
+    def to_json(self) -> bytes:
+        """Serialize the document to compact UTF-8 JSON, leaving out None values."""
+        rendered: str = self.model_dump_json(exclude_none=True)  # type: ignore[attr-defined]
+        return rendered.encode("utf-8")
+
     def _add_data(self, result: Dict[str, Any]) -> None:
         data = getattr(self, "data", None)
         if data:
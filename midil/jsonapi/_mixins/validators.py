@@ -1,12 +1,16 @@
-from typing import Optional, Self
+from typing import TYPE_CHECKING, Optional, Self
 
 from pydantic import field_validator, model_validator
 
 
 class ResourceIdentifierValidatorMixin:
+    if TYPE_CHECKING:
+        id: Optional[str]
+        lid: Optional[str]
+
     @model_validator(mode="after")
     def validate_resource_identifier(self) -> "Self":
-        if not getattr(self, "id", None) and not getattr(self, "lid", None):
+        if not self.id and not self.lid:
             raise ValueError(
                 "Either 'id' or 'lid' must be provided in a resource identifier"
             )
@@ -14,11 +18,16 @@ class ResourceIdentifierValidatorMixin:
 
 
 class ResourceValidatorMixin:
+    if TYPE_CHECKING:
+        type: Optional[str]
+        id: Optional[str]
+        lid: Optional[str]
+
     @model_validator(mode="after")
     def validate_resource(self) -> "Self":
-        if not getattr(self, "type", None):
+        if not self.type:
             raise ValueError("The 'type' field is required in a resource")
-        if not getattr(self, "id", None) and not getattr(self, "lid", None):
+        if not self.id and not self.lid:
             raise ValueError(
                 "At least one of 'id' or 'lid' must be present in a resource"
             )
@@ -28,8 +37,6 @@ class ResourceValidatorMixin:
 class ErrorSourceValidatorMixin:
     @field_validator("pointer")
     def validate_json_pointer(cls, pointer: Optional[str]) -> Optional[str]:
-        if pointer is None:
-            return None
-        if not isinstance(pointer, str) or not pointer.startswith("/"):
+        if pointer is not None and not pointer.startswith("/"):
             raise ValueError("JSON pointer must be a string starting with '/'")
         return pointer
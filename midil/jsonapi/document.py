@@ -1,7 +1,12 @@
 from __future__ import annotations  # noqa: F401
 
+from types import MappingProxyType
 from typing import (
     Any,
+    Dict,
+    Iterable,
+    Tuple,
+    Type,
     Mapping,
     List,
     Optional,
@@ -11,8 +16,9 @@ from typing import (
     Generic,
     Annotated,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from midil.jsonapi._mixins.constructors import TrustedConstructorMixin
 from midil.jsonapi._mixins.serializers import (
     DocumentSerializerMixin,
     ErrorSerializerMixin,
@@ -22,6 +28,7 @@ from midil.jsonapi._mixins.validators import (
     ErrorSourceValidatorMixin,
 )
 from midil.jsonapi.config import (
+    Extra,
     ForbidExtraFieldsModel,
     AllowExtraFieldsModel,
 )
@@ -50,9 +57,15 @@ ErrorList: TypeAlias = Annotated[
     Doc("A list of error objects."),
 ]
 
+# Patterns shared by every model below. pydantic-core matches them in Rust, so they
+# stay as `pattern=` constraints rather than Python-level validators.
+ID_PATTERN = r"^[a-zA-Z0-9_-]+$"
+TYPE_PATTERN = r"^[a-zA-Z][a-zA-Z0-9_-]*$"
+STATUS_PATTERN = r"^[1-5][0-9]{2}$"
+
 LidStr = Annotated[
     str,
-    Field(pattern=r"^[a-zA-Z0-9_-]+$"),
+    Field(pattern=ID_PATTERN),
     Doc(
         "Optional client-generated ID (local ID) for correlation, not for persistence."
     ),
@@ -60,13 +73,13 @@ LidStr = Annotated[
 
 IDStr = Annotated[
     str,
-    Field(pattern=r"^[a-zA-Z0-9_-]+$"),
+    Field(pattern=ID_PATTERN),
     Doc("The resource identifier."),
 ]
 
 TypeStr = Annotated[
     str,
-    Field(pattern=r"^[a-zA-Z][a-zA-Z0-9_-]*$"),
+    Field(pattern=TYPE_PATTERN),
     Doc("The resource type."),
 ]
 
@@ -76,40 +89,16 @@ AttributesT = TypeVar("AttributesT", bound=Union[BaseModel, Mapping[str, Any]])
 JSONAPI_CONTENT_TYPE = "application/vnd.midil+json"
 JSONAPI_ACCEPT = "application/vnd.midil+json"
 JSONAPI_VERSION = "1.1"
+JSONAPI_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "jsonapi-version": JSONAPI_VERSION,
+        "accept": JSONAPI_ACCEPT,
+        "content-type": JSONAPI_CONTENT_TYPE,
+    }
+)
 
 
-# DRY helpers for common fields
-class _MetaMixin(BaseModel):
-    """Mixin for including a 'meta' member as per JSON:API specification.
-    https://jsonapi.org/format/#document-meta
-    """
-
-    meta: MetaType = None
-
-
-class _LinksMixin(BaseModel):
-    """Mixin for including a 'links' member as per JSON:API specification.
-    https://jsonapi.org/format/#document-links
-    """
-
-    links: Annotated[
-        Optional["Links"],
-        Doc("A links object that contains further details about this link."),
-    ] = None
-
-
-class _RelationshipsMixin(BaseModel):
-    """Mixin for including a 'relationships' member as per JSON:API specification.
-    https://jsonapi.org/format/#document-relationships
-    """
-
-    relationships: Annotated[
-        Optional[Mapping[str, "RelationshipObject"]],
-        Doc("A dictionary of relationship objects keyed by their names."),
-    ] = None
-
-
-class JSONAPIObject(AllowExtraFieldsModel, _MetaMixin):
+class JSONAPIObject(AllowExtraFieldsModel):
     """
     Represents the 'jsonapi' object describing the server's implementation.
 
@@ -122,6 +111,10 @@ class JSONAPIObject(AllowExtraFieldsModel, _MetaMixin):
     https://jsonapi.org/format/#document-jsonapi-object
     """
 
+    # Frozen so one default instance can be shared by every document.
+    model_config = ConfigDict(extra=Extra.ALLOW.value, frozen=True)
+
+    meta: MetaType = None
     version: Annotated[
         str,
         Doc("The version of the JSON:API specification implemented."),
@@ -136,6 +129,15 @@ class JSONAPIObject(AllowExtraFieldsModel, _MetaMixin):
     ] = None
 
 
+DEFAULT_JSONAPI_OBJECT = JSONAPIObject()
+
+
+def _default_jsonapi_object() -> JSONAPIObject:
+    # A plain model default is deep-copied for every document; a factory
+    # returning the shared frozen instance is not.
+    return DEFAULT_JSONAPI_OBJECT
+
+
 class ErrorSource(ForbidExtraFieldsModel, ErrorSourceValidatorMixin):
     """
     Represents the 'source' object in a JSON:API error.
@@ -178,7 +180,7 @@ class ErrorLinks(ForbidExtraFieldsModel):
     ] = None
 
 
-class ErrorObject(AllowExtraFieldsModel, ErrorSerializerMixin, _MetaMixin):
+class ErrorObject(AllowExtraFieldsModel, ErrorSerializerMixin):
     """
     Represents an error object as per JSON:API specification.
 
@@ -195,13 +197,14 @@ class ErrorObject(AllowExtraFieldsModel, ErrorSerializerMixin, _MetaMixin):
     https://jsonapi.org/format/#error-objects
     """
 
+    meta: MetaType = None
     id: Annotated[
         Optional[str],
         Doc("A unique identifier for this particular occurrence of the problem."),
     ] = None
     status: Annotated[
         str,
-        Field(pattern=r"^[1-5][0-9]{2}$"),
+        Field(pattern=STATUS_PATTERN),
         Doc("The HTTP status code applicable to this problem, as a string."),
     ]
     code: Annotated[
@@ -226,7 +229,7 @@ class ErrorObject(AllowExtraFieldsModel, ErrorSerializerMixin, _MetaMixin):
     ] = None
 
 
-class LinkObject(ForbidExtraFieldsModel, _MetaMixin):
+class LinkObject(ForbidExtraFieldsModel):
     """
     Represents a link object as per JSON:API specification.
 
@@ -242,6 +245,7 @@ class LinkObject(ForbidExtraFieldsModel, _MetaMixin):
     https://jsonapi.org/format/#auto-id--link-objects
     """
 
+    meta: MetaType = None
     href: str
     rel: Optional[str] = None
     describedby: Optional[str] = None
@@ -291,7 +295,7 @@ class Links(ForbidExtraFieldsModel):
     ] = None
 
 
-class RelationshipObject(ForbidExtraFieldsModel, _LinksMixin, _MetaMixin):
+class RelationshipObject(ForbidExtraFieldsModel):
     """
     Represents a relationship object as per JSON:API specification.
 
@@ -303,13 +307,18 @@ class RelationshipObject(ForbidExtraFieldsModel, _LinksMixin, _MetaMixin):
     https://jsonapi.org/format/#document-resource-object-relationships
     """
 
+    meta: MetaType = None
+    links: Annotated[
+        Optional["Links"],
+        Doc("A links object that contains further details about this link."),
+    ] = None
     data: Annotated[
         Optional[RelationshipType],
         Doc("Resource linkage (to-one or to-many)."),
     ] = None
 
 
-class ResourceIdentifierObject(ForbidExtraFieldsModel, _MetaMixin):
+class ResourceIdentifierObject(ForbidExtraFieldsModel):
     """
     Represents a resource identifier object as per JSON:API specification.
 
@@ -321,6 +330,7 @@ class ResourceIdentifierObject(ForbidExtraFieldsModel, _MetaMixin):
     https://jsonapi.org/format/#document-resource-identifier-objects
     """
 
+    meta: MetaType = None
     id: IDStr
     type: TypeStr
 
@@ -328,9 +338,7 @@ class ResourceIdentifierObject(ForbidExtraFieldsModel, _MetaMixin):
 class _ResourceBase(
     ForbidExtraFieldsModel,
     ResourceSerializerMixin,
-    _LinksMixin,
-    _MetaMixin,
-    _RelationshipsMixin,
+    TrustedConstructorMixin,
     Generic[AttributesT],
 ):
     """
@@ -344,6 +352,15 @@ class _ResourceBase(
         relationships: Relationships to other resources.
     """
 
+    relationships: Annotated[
+        Optional[Mapping[str, "RelationshipObject"]],
+        Doc("A dictionary of relationship objects keyed by their names."),
+    ] = None
+    meta: MetaType = None
+    links: Annotated[
+        Optional["Links"],
+        Doc("A links object that contains further details about this link."),
+    ] = None
     type: TypeStr
     attributes: Annotated[
         Optional[AttributesT],
@@ -385,6 +402,7 @@ class ResourceObject(
 class Document(
     ForbidExtraFieldsModel,
     DocumentSerializerMixin,
+    TrustedConstructorMixin,
     Generic[AttributesT],
 ):
     """
@@ -428,7 +446,7 @@ class Document(
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the primary data."),
@@ -484,7 +502,7 @@ class ErrorDocument(ForbidExtraFieldsModel):
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the error(s)."),
@@ -499,6 +517,9 @@ class Header(AllowExtraFieldsModel):
         version: The JSON:API version (as 'jsonapi-version' header).
         accept: The Accept header value.
         content_type: The Content-Type header value.
+
+    Use this to parse incoming headers. Outgoing responses should use the static
+    `JSONAPI_DEFAULT_HEADERS` mapping instead of building a model per response.
     """
 
     version: Annotated[
@@ -548,7 +569,7 @@ class PostDocument(
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the primary data."),
@@ -593,7 +614,7 @@ class PatchDocument(
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the primary data."),
@@ -620,7 +641,7 @@ class PatchMultiDocument(
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the primary data."),
@@ -647,8 +668,48 @@ class PostMultiDocument(
     jsonapi: Annotated[
         Optional[JSONAPIObject],
         Doc("Information about the JSON:API implementation."),
-    ] = JSONAPIObject()
+    ] = Field(default_factory=_default_jsonapi_object)
     links: Annotated[
         Optional[Links],
         Doc("Links related to the primary data."),
     ] = None
+
+
+# RelationshipObject refers to models declared after it, so pydantic leaves it
+# incomplete and rebuilds it lazily on first validation. Resolve it at import
+# instead of inside the first request that touches a relationship.
+RelationshipObject.model_rebuild()
+
+
+_GENERIC_MODELS: Tuple[Type[BaseModel], ...] = (
+    ResourceObject,
+    Document,
+    PostDocument,
+    PatchDocument,
+    PostMultiDocument,
+    PatchMultiDocument,
+)
+
+# pydantic only caches parametrized generics weakly; keep warmed ones alive.
+_WARM_MODELS: Dict[Tuple[Type[BaseModel], Any], Type[BaseModel]] = {}
+
+
+def warmup_jsonapi(attribute_types: Iterable[Any]) -> None:
+    """
+    Build the parametrized JSON:API models for each attributes type up front.
+
+    `Document[MyAttributes]` and friends are created and compiled on first use,
+    which otherwise lands on whichever request needs them first. Call this from
+    the app factory or lifespan with every attributes model the service uses.
+
+    Example:
+        ```python
+        warmup_jsonapi([UserAttributes, OrderAttributes])
+        ```
+    """
+    for attributes in attribute_types:
+        for model in _GENERIC_MODELS:
+            parametrized = model[attributes]  # type: ignore[index]
+            if not parametrized.__pydantic_complete__:
+                parametrized.model_rebuild()
+            _WARM_MODELS[(model, attributes)] = parametrized
@@ -2,7 +2,7 @@ from enum import StrEnum
 from typing import List, Optional, Annotated
 from typing_extensions import Doc
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from dataclasses import dataclass
 
@@ -37,9 +37,8 @@ class PaginationParams(BaseModel):
         ),
     ] = Constants.DEFAULT_PAGE_SIZE
 
-    class Config:
-        frozen = True
-        populate_by_name = True  # Allows using aliases like page[number]
+    # populate_by_name allows using aliases like page[number]
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
 
 
 class SortDirection(StrEnum):
@@ -65,8 +64,7 @@ class SortField(BaseModel):
             direction=SortDirection.DESC if raw.startswith("-") else SortDirection.ASC,
         )
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class Sort(BaseModel):
@@ -78,15 +76,11 @@ class Sort(BaseModel):
         if not string:
             return cls(fields=[])
 
-        fields = [
-            SortField.from_raw(field.strip())
-            for field in string.split(",")
-            if field.strip()
-        ]
+        stripped = (field.strip() for field in string.split(","))
+        fields = [SortField.from_raw(field) for field in stripped if field]
         return cls(fields=fields)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class Include(BaseModel):
@@ -107,8 +101,7 @@ class Include(BaseModel):
                 )
         return v
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class QueryParams(BaseModel):
@@ -116,5 +109,4 @@ class QueryParams(BaseModel):
     sort: Optional[Sort] = None
     include: Optional[Include] = None
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
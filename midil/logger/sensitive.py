@@ -29,8 +29,14 @@ secret_patterns = {
 }
 
 
+_default_compiled_patterns = tuple(
+    re.compile(pattern) for pattern in secret_patterns.values()
+)
+
+
 class SensitiveLogFilter:
-    compiled_patterns = [re.compile(pattern) for pattern in secret_patterns.values()]
+    def __init__(self) -> None:
+        self.compiled_patterns: list[re.Pattern[str]] = list(_default_compiled_patterns)
 
     def hide_sensitive_strings(self, *tokens: str) -> None:
         self.compiled_patterns.extend(
@@ -1,8 +1,21 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from fastapi import Query
 from midil.jsonapi.query import Sort, SortField, Include
 
 
+# Sort and Include are frozen, so one validated instance can be shared between
+# every request sending the same query values.
+@lru_cache(maxsize=1024)
+def _build_sort(fields: Tuple[str, ...]) -> Sort:
+    return Sort(fields=[SortField.from_raw(s) for s in fields])
+
+
+@lru_cache(maxsize=1024)
+def _build_include(relationships: Tuple[str, ...]) -> Include:
+    return Include(relationships=list(relationships))
+
+
 def parse_sort(sort: Optional[List[str]] = Query(None, alias="sort")) -> Optional[Sort]:
     """
     Parses the 'sort' query parameter into a `Sort` object.
@@ -31,7 +44,7 @@ def parse_sort(sort: Optional[List[str]] = Query(None, alias="sort")) -> Optiona
         ```
     """
     if sort:
-        return Sort(fields=[SortField.from_raw(s) for s in sort])
+        return _build_sort(tuple(sort))
     return None
 
 
@@ -63,5 +76,5 @@ def parse_include(
         ```
     """
     if include:
-        return Include(relationships=include)
+        return _build_include(tuple(include))
     return None
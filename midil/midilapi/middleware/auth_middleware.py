@@ -1,22 +1,35 @@
-from typing import Dict, Any, Callable, Awaitable
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, Any, Mapping, Optional
 from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from midil.auth.interfaces.authorizer import AuthZProvider
 from midil.auth.interfaces.models import AuthZTokenClaims
 from midil.auth.cognito.jwt_authorizer import CognitoJWTAuthorizer
 from starlette.exceptions import HTTPException
-from starlette.responses import Response
 from midil.auth.exceptions import AuthorizationError
+from midil.midilapi.exceptions import HTTPExceptionHandler
 from midil.settings import get_auth_settings
 
 
+_AUTHORIZATION_HEADER = b"authorization"
+
+
+def _get_authorization(scope: Scope) -> Optional[str]:
+    # ASGI servers lowercase header names, so the raw header list can be scanned
+    # with a plain bytes comparison instead of going through `Headers.get`.
+    for key, value in scope["headers"]:
+        if key == _AUTHORIZATION_HEADER:
+            return value.decode("latin-1")
+    return None
+
+
 class AuthContext:
     """
     Holds decoded token claims and raw authentication headers from a request.
 
     Attributes:
         claims (AuthZTokenClaims): The decoded JWT claims.
-        _raw_headers (Dict[str, Any]): Raw HTTP headers related to authentication.
+        _raw_headers (Dict[str, Any]): Raw HTTP headers related to authentication,
+            copied out of the request headers only when first read.
 
     Usage:
         ```python
@@ -28,17 +41,24 @@ class AuthContext:
     def __init__(
         self,
         claims: AuthZTokenClaims,
-        _raw_headers: Dict[str, Any],
+        _raw_headers: Mapping[str, Any],
     ) -> None:
         """
         Initialize the authentication context.
 
         Args:
             claims (AuthZTokenClaims): The decoded token claims.
-            _raw_headers (Dict[str, Any]): Raw HTTP headers from the request.
+            _raw_headers (Mapping[str, Any]): Raw HTTP headers from the request.
         """
         self.claims = claims
-        self._raw_headers = _raw_headers
+        self._headers = _raw_headers
+        self._headers_dict: Optional[Dict[str, Any]] = None
+
+    @property
+    def _raw_headers(self) -> Dict[str, Any]:
+        if self._headers_dict is None:
+            self._headers_dict = dict(self._headers)
+        return self._headers_dict
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -47,7 +67,7 @@ class AuthContext:
         }
 
 
-class BaseAuthMiddleware(BaseHTTPMiddleware):
+class BaseAuthMiddleware:
     """
     Base middleware for extracting authentication headers from the request and storing
     authentication context in the request state.
@@ -86,30 +106,57 @@ class BaseAuthMiddleware(BaseHTTPMiddleware):
     ```
 
     After authentication, the request's state will have an `auth` attribute containing
-    an AuthContext instance with the decoded claims and raw headers.
+    an AuthContext instance with the decoded claims and raw headers. Requests that fail
+    authentication are answered with a JSON:API 401 error and never reach the app.
+
+    This is a plain ASGI middleware rather than a `BaseHTTPMiddleware`, so it adds no
+    extra task or response stream to each request.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         try:
-            if "authorization" not in request.headers:
+            await self.authenticate(request)
+        except HTTPException as exc:
+            response = await HTTPExceptionHandler().handle(request, exc)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def authenticate(self, request: Request) -> None:
+        """
+        Verify the request's bearer token and store an AuthContext on `request.state.auth`.
+
+        Args:
+            request (Request): The incoming HTTP request.
+
+        Raises:
+            HTTPException: 401 if the Authorization header is missing or the token
+                is rejected by the authorizer.
+        """
+        try:
+            authorization = _get_authorization(request.scope)
+            if authorization is None:
                 raise HTTPException(
                     status_code=401, detail="Authorization header is missing"
                 )
-            token = self._resolve_bearer_token(request.headers["authorization"])
+            token = self._resolve_bearer_token(authorization)
 
             authorizer = await self.authorizer(request)
             claims = await authorizer.verify(token)
 
             request.state.auth = AuthContext(
                 claims=claims,
-                _raw_headers=dict(request.headers),
+                _raw_headers=request.headers,
             )
-            response = await call_next(request)
-            return response
 
         except AuthorizationError as e:
             raise HTTPException(status_code=401, detail=str(e)) from e
@@ -177,8 +224,15 @@ class CognitoAuthMiddleware(BaseAuthMiddleware):
 
     """
 
+    _authorizer: Optional[AuthZProvider] = None
+
     async def authorizer(self, request: Request) -> AuthZProvider:
-        cognito_settings = get_auth_settings("cognito")
-        return CognitoJWTAuthorizer(
-            user_pool_id=cognito_settings.user_pool_id, region=cognito_settings.region
-        )
+        # Built on first use and reused for every request, so the JWKS cache held
+        # by the authorizer survives across requests.
+        if self._authorizer is None:
+            cognito_settings = get_auth_settings("cognito")
+            self._authorizer = CognitoJWTAuthorizer(
+                user_pool_id=cognito_settings.user_pool_id,
+                region=cognito_settings.region,
+            )
+        return self._authorizer
@@ -1,13 +1,17 @@
 from fastapi.responses import JSONResponse
 from midil.jsonapi import Document, ErrorDocument
+from pydantic import BaseModel
 from typing import Any
 from midil.jsonapi.document import JSONAPI_CONTENT_TYPE
 
 
 class JSONAPIResponse(JSONResponse):
     def __init__(self, document: Document[Any] | ErrorDocument, **kwargs):
-        super().__init__(
-            content=document.model_dump(exclude_none=True),
-            media_type=JSONAPI_CONTENT_TYPE,
-            **kwargs
-        )
+        super().__init__(content=document, media_type=JSONAPI_CONTENT_TYPE, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        # Serialize straight to JSON bytes with pydantic-core instead of building
+        # a dict with `model_dump` and encoding it again with `json.dumps`.
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(exclude_none=True).encode("utf-8")
+        return super().render(content)
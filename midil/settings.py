@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Literal, TypeVar, Any
+from typing import Dict, Mapping, Optional, Literal, TypeVar, Any
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from midil.auth.config import AuthConfig
 from midil.midilapi.config import MidilApiConfig
@@ -15,6 +15,7 @@ from pydantic import Field
 
 
 T = TypeVar("T", bound=BaseSettings)
+C = TypeVar("C")
 
 
 class _BaseSettings(BaseSettings):
@@ -96,6 +97,16 @@ def get_settings() -> MidilSettings:
     return settings
 
 
+def clear_settings_cache() -> None:
+    """
+    Drop the cached MidilSettings so the next lookup re-reads the environment.
+
+    Settings are read once per process; call this after changing MIDIL__* variables
+    or the .env file at runtime, e.g. in tests.
+    """
+    get_settings.cache_clear()
+
+
 def get_api_settings() -> MidilApiConfig:
     """Get API settings, raising an error if not configured."""
     settings = get_settings()
@@ -143,6 +154,28 @@ def get_auth_settings(expected: Literal["cognito"]) -> AuthConfig:
     return settings.auth
 
 
+def _get_named_config(
+    configs: Optional[Mapping[str, C]],
+    name: str,
+    kind: Literal["consumer", "producer"],
+) -> C:
+    """Look up a consumer or producer configuration by (case-insensitive) name."""
+    env_var = f"MIDIL__EVENT__{kind.upper()}S"
+    if configs is None:
+        raise EventSettingsError(
+            f"No {kind} configurations found. Ensure {env_var} is set."
+        )
+    name = name.lower()
+    try:
+        return configs[name]
+    except KeyError:
+        available = list(configs.keys())
+        raise EventSettingsError(
+            f"{kind.capitalize()} '{name}' not found. Available {kind}s: {available}. "
+            f"Check {env_var} in the .env file."
+        )
+
+
 def get_consumer_event_settings(name: str) -> ConsumerConfig:
     """
     Get consumer configuration by name.
@@ -156,20 +189,7 @@ def get_consumer_event_settings(name: str) -> ConsumerConfig:
     Example:
         >>> consumer = get_consumer_event_settings("sqs_consumer")
     """
-    name = name.lower()
-    consumers = get_event_settings().consumers
-    if consumers is None:
-        raise EventSettingsError(
-            "No consumer configurations found. Ensure MIDIL__EVENT__CONSUMERS is set."
-        )
-    try:
-        return consumers[name]
-    except KeyError:
-        available = list(consumers.keys())
-        raise EventSettingsError(
-            f"Consumer '{name}' not found. Available consumers: {available}. "
-            "Check MIDIL__EVENT__CONSUMERS in the .env file."
-        )
+    return _get_named_config(get_event_settings().consumers, name, "consumer")
 
 
 def get_producer_event_settings(name: str) -> ProducerConfig:
@@ -185,20 +205,7 @@ def get_producer_event_settings(name: str) -> ProducerConfig:
     Example:
         >>> producer = get_producer_event_settings("sqs_producer")
     """
-    name = name.lower()
-    producers = get_event_settings().producers
-    if producers is None:
-        raise EventSettingsError(
-            "No producer configurations found. Ensure MIDIL__EVENT__PRODUCERS is set."
-        )
-    try:
-        return producers[name]
-    except KeyError:
-        available = list(producers.keys())
-        raise EventSettingsError(
-            f"Producer '{name}' not found. Available producers: {available}. "
-            "Check MIDIL__EVENT__PRODUCERS in the .env file."
-        )
+    return _get_named_config(get_event_settings().producers, name, "producer")
 
 
 def get_consumers_by_type(type: EventConsumerType) -> Dict[str, ConsumerConfig]:
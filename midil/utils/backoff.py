@@ -5,6 +5,8 @@ import random
 class BackoffStrategy(abc.ABC):
     """Abstract base for backoff strategies"""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def next_delay(self, attempt: int) -> float:
         raise NotImplementedError
@@ -13,6 +15,8 @@ class BackoffStrategy(abc.ABC):
 class ExponentialBackoff(BackoffStrategy):
     """Exponential backoff without jitter"""
 
+    __slots__ = ("base_delay", "max_delay")
+
     def __init__(self, base_delay: float = 1.0, max_delay: float = 60.0) -> None:
         self.base_delay = base_delay
         self.max_delay = max_delay
@@ -22,6 +26,8 @@ class ExponentialBackoff(BackoffStrategy):
 
 
 class ExponentialBackoffWithJitter(BackoffStrategy):
+    __slots__ = ("base", "cap", "jitter")
+
     def __init__(
         self, base: float = 1.0, cap: float = 60.0, jitter: float = 0.2
     ) -> None:
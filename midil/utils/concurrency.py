@@ -0,0 +1,40 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import anyio.to_thread
+
+
+THREAD_POOL_SIZE_ENV = "MIDIL__THREAD_POOL_SIZE"
+DEFAULT_THREAD_POOL_SIZE = 64
+
+
+def configure_thread_pool(size: Optional[int] = None) -> int:
+    """
+    Size the thread pools used to run sync callables off the event loop.
+
+    Sync handlers and scheduled tasks go through ``anyio.to_thread.run_sync``
+    (anyio's default limiter, 40 threads) and ``asyncio.to_thread`` goes through the
+    loop's default executor (``min(32, cpu_count + 4)`` threads). Both are small for
+    I/O-bound work, so sync callables end up queueing behind each other.
+
+    Must be called from within the running event loop, typically on app startup.
+
+    Args:
+        size: Number of worker threads. Defaults to ``MIDIL__THREAD_POOL_SIZE``
+            or 64 when unset.
+
+    Returns:
+        The pool size that was applied.
+    """
+    if size is None:
+        size = int(os.getenv(THREAD_POOL_SIZE_ENV, DEFAULT_THREAD_POOL_SIZE))
+    if size < 1:
+        raise ValueError(f"Thread pool size must be at least 1, got {size}")
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=size, thread_name_prefix="midil")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
+    return size
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import (
@@ -14,12 +16,7 @@ from typing import (
 
 from loguru import logger
 
-from tenacity import (
-    AsyncRetrying,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential_jitter,
-)
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt
 from tenacity.wait import wait_base
 
 P = ParamSpec("P")
@@ -30,8 +27,24 @@ CoroutineCallable = Callable[P, Coroutine[Any, Any, R]]
 
 _DEFAULT_MAX_ATTEMPTS = 3
 
+# Same defaults as tenacity's wait_exponential_jitter.
+_DEFAULT_INITIAL_DELAY = 1.0
+_DEFAULT_MAX_DELAY = 60.0
+_DEFAULT_JITTER = 1.0
+
+
+def _exponential_jitter_delay(attempt_number: int) -> float:
+    """Seconds to wait after `attempt_number` failed: 1, 2, 4, ... plus jitter."""
+    try:
+        delay = _DEFAULT_INITIAL_DELAY * 2 ** (attempt_number - 1)
+    except OverflowError:
+        delay = _DEFAULT_MAX_DELAY
+    return min(delay + random.uniform(0, _DEFAULT_JITTER), _DEFAULT_MAX_DELAY)
+
 
 class BaseAsyncRetryPolicy(ABC):
+    __slots__ = ()
+
     @abstractmethod
     async def __call__(
         self, func: Callable[..., Awaitable[Any]], *args, **kwargs
@@ -47,6 +60,8 @@ class BaseAsyncRetryPolicy(ABC):
 
 
 class AsyncRetry(BaseAsyncRetryPolicy):
+    __slots__ = ("max_attempts", "wait", "retry_on_exceptions")
+
     def __init__(
         self,
         max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
@@ -57,30 +72,55 @@ class AsyncRetry(BaseAsyncRetryPolicy):
         Args:
             max_attempts: Maximum number of retry attempts.
             wait: Any tenacity wait strategy (e.g. wait_exponential, wait_fixed, wait_random_exponential).
-                  Defaults to exponential backoff.
+                  Defaults to exponential backoff with jitter.
             retry_on_exceptions: Which exceptions should trigger a retry.
         """
         self.max_attempts = max_attempts
-        self.wait = wait or wait_exponential_jitter()
+        self.wait = wait
         self.retry_on_exceptions = retry_on_exceptions
 
     async def __call__(
         self, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        if self.wait is not None:
+            return await self._call_with_wait(self.wait, func, *args, **kwargs)
+
+        # The default backoff needs no retry state, so no tenacity machinery is
+        # built for it.
+        attempt_number = 1
+        while True:
+            self._log_attempt(attempt_number, func, args, kwargs)
+            try:
+                return await func(*args, **kwargs)
+            except self.retry_on_exceptions:
+                if attempt_number >= self.max_attempts:
+                    raise
+            await asyncio.sleep(_exponential_jitter_delay(attempt_number))
+            attempt_number += 1
+
+    async def _call_with_wait(
+        self, wait: wait_base, func: Callable[..., Awaitable[Any]], *args, **kwargs
     ) -> Any:
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(self.max_attempts),
-            wait=self.wait,
-            retry=retry_if_exception_type(*self.retry_on_exceptions),
+            wait=wait,
+            retry=retry_if_exception_type(self.retry_on_exceptions),
             reraise=True,
         ):
             with attempt:
-                attempt_number = attempt.retry_state.attempt_number
-                logger.debug(
-                    f"Attempt {attempt_number}: Executing function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}."
+                self._log_attempt(
+                    attempt.retry_state.attempt_number, func, args, kwargs
                 )
-
                 return await func(*args, **kwargs)
 
+    @staticmethod
+    def _log_attempt(
+        attempt_number: int, func: Callable[..., Any], args: Any, kwargs: Any
+    ) -> None:
+        logger.debug(
+            f"Attempt {attempt_number}: Executing function '{func.__name__}' with arguments {args} and keyword arguments {kwargs}."
+        )
+
     def retry(self, func: Callable[..., Awaitable[Any]]) -> CoroutineCallable[P, R]:
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -310,6 +310,23 @@ class TestCognitoClientCredentialsAuthenticator:
                 time_diff < 5
             ), f"Expected expiration around {expected_expires}, got {expires_at}"
 
+    @pytest.mark.asyncio
+    async def test_fetched_token_is_reused_until_expiry(
+        self, auth_client, mock_token_response
+    ):
+        """Test that a token fetched with expires_in is served from cache afterwards."""
+        mock_token_response["expires_in"] = "3600"
+
+        with patch.object(
+            auth_client, "_fetch_token", return_value=mock_token_response
+        ) as mock_fetch:
+            first = await auth_client.get_token()
+            second = await auth_client.get_token()
+
+            assert not first.expired
+            assert second is first
+            mock_fetch.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_token_creation_without_expires_in(self, auth_client):
         """Test token creation when response doesn't include expires_in."""
@@ -541,8 +541,53 @@ async def test_concurrent_signing_key_fetch() -> None:
         mock_get_key.return_value.key = "mock-public-key"
         mock_decode.return_value = token_payload
 
-        token: str = "simultaneous.jwt.token"
-        results = await asyncio.gather(*[authorizer.verify(token) for _ in range(10)])
+        results = await asyncio.gather(
+            *[authorizer.verify(f"simultaneous.jwt.token.{i}") for i in range(10)]
+        )
 
         assert all(isinstance(r, CognitoTokenClaims) for r in results)
         assert mock_get_key.call_count == 10  # Ensures it handles concurrent requests
+
+
+@pytest.mark.asyncio
+@patch("midil.auth.cognito.jwt_authorizer.jwt.decode")
+@patch("midil.auth.cognito.jwt_authorizer.CognitoJWTAuthorizer._get_signing_key")
+async def test_verified_token_is_cached(
+    mock_get_key: Mock, mock_decode: Mock, valid_token_payload: Dict[str, Any]
+) -> None:
+    mock_get_key.return_value.key = "public_key"
+    mock_decode.return_value = valid_token_payload
+
+    authorizer: CognitoJWTAuthorizer = CognitoJWTAuthorizer(
+        "test-pool", "us-west-2", audience="test-client-id"
+    )
+    first: AuthZTokenClaims = await authorizer.verify("valid.token.here")
+    second: AuthZTokenClaims = await authorizer.verify("valid.token.here")
+
+    assert second is first
+    assert mock_decode.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("midil.auth.cognito.jwt_authorizer.jwt.decode")
+@patch("midil.auth.cognito.jwt_authorizer.CognitoJWTAuthorizer._get_signing_key")
+async def test_cached_token_is_reverified_after_expiry(
+    mock_get_key: Mock, mock_decode: Mock, valid_token_payload: Dict[str, Any]
+) -> None:
+    mock_get_key.return_value.key = "public_key"
+    mock_decode.return_value = valid_token_payload
+
+    authorizer: CognitoJWTAuthorizer = CognitoJWTAuthorizer(
+        "test-pool", "us-west-2", audience="test-client-id"
+    )
+    await authorizer.verify("valid.token.here")
+
+    mock_decode.side_effect = jwt.ExpiredSignatureError("Token has expired")
+    with patch(
+        "midil.auth.cognito.jwt_authorizer.time.time",
+        return_value=valid_token_payload["exp"],
+    ):
+        with pytest.raises(CognitoAuthorizationError):
+            await authorizer.verify("valid.token.here")
+
+    assert mock_decode.call_count == 2
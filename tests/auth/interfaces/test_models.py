@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from dateutil import parser
+from unittest.mock import patch
 
 from midil.auth.interfaces.models import (
     ExpirableTokenMixin,
@@ -111,6 +112,21 @@ class TestAuthNToken:
             result = token.expires_at()
             assert isinstance(result, datetime)
 
+    def test_expires_at_parses_once(self):
+        """Test that the expiry string is parsed once and re-parsed only if it changes."""
+        token = AuthNToken(token="test-token", expires_at_iso="2023-12-31T23:59:59Z")
+
+        with patch(
+            "midil.auth.interfaces.models.isoparse", wraps=parser.isoparse
+        ) as isoparse:
+            first = token.expires_at()
+            assert token.expires_at() is first
+            assert isoparse.call_count == 1
+
+            token.expires_at_iso = "2024-01-31T23:59:59Z"
+            assert token.expires_at() == parser.isoparse("2024-01-31T23:59:59Z")
+            assert isoparse.call_count == 2
+
 
 class TestAuthNHeaders:
     """Tests for AuthNHeaders."""
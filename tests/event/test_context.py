@@ -130,7 +130,7 @@ class TestEventContextManager:
         # All IDs should be unique
         assert len(set(ids)) == 5
 
-        # IDs should be valid hex strings (from uuid4().hex)
+        # IDs should be valid hex strings
         for id_str in ids:
             # Should be 32 character hex string
             assert len(id_str) == 32
@@ -236,16 +236,15 @@ class TestEventContextManager:
         context_ids = [result[1] for result in results]
         assert len(set(context_ids)) == 5
 
-    @patch("midil.event.context.uuid4")
-    async def test_event_context_uuid_generation(self, mock_uuid4) -> None:
-        """Test that event_context uses uuid4 for ID generation."""
-        mock_uuid = type("MockUUID", (), {"hex": "mocked-uuid-hex"})()
-        mock_uuid4.return_value = mock_uuid
+    @patch("midil.event.context.id_factory")
+    async def test_event_context_id_generation(self, mock_id_factory) -> None:
+        """Test that event_context uses the id_factory hook for ID generation."""
+        mock_id_factory.return_value = "mocked-id"
 
         async with event_context("test.event") as ctx:
-            assert ctx.id == "mocked-uuid-hex"
+            assert ctx.id == "mocked-id"
 
-        mock_uuid4.assert_called_once()
+        mock_id_factory.assert_called_once_with()
 
     async def test_event_context_with_none_parent_override(self) -> None:
         """Test event_context with None as parent_override."""
@@ -284,4 +283,4 @@ class TestEventContextManager:
         async with event_context("") as ctx:
             assert ctx.event_type == ""
             assert isinstance(ctx.id, str)
-            assert len(ctx.id) == 32  # uuid4().hex length
+            assert len(ctx.id) == 32
@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from midil.event.config import EventConfig
+from midil.event.consumer.webhook import WebhookConsumer, WebhookConsumerEventConfig
+from midil.event.event_bus import EventBus, EventBusFactory
+from midil.event.producer.redis import RedisProducer, RedisProducerEventConfig
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestEventBusFactory:
+    """Tests for EventBusFactory transport lookup."""
+
+    async def test_config_lookups_are_derived_from_transports(self):
+        """Test that each transport's config classes map to its classes."""
+        assert EventBusFactory._PRODUCERS_BY_CONFIG[RedisProducerEventConfig] is (
+            RedisProducer
+        )
+        assert EventBusFactory._CONSUMERS_BY_CONFIG[WebhookConsumerEventConfig] is (
+            WebhookConsumer
+        )
+        assert len(EventBusFactory._PRODUCERS_BY_CONFIG) == sum(
+            t.producer is not None for t in EventBusFactory._TRANSPORTS.values()
+        )
+        assert len(EventBusFactory._CONSUMERS_BY_CONFIG) == sum(
+            t.consumer is not None for t in EventBusFactory._TRANSPORTS.values()
+        )
+
+    async def test_create_config_prefers_producer_config(self):
+        """Test that create_config builds the producer config for dual transports."""
+        config = EventBusFactory.create_config(
+            "sqs", queue_url="https://sqs.us-east-1.amazonaws.com/123/events"
+        )
+
+        assert type(config).__name__ == "SQSProducerEventConfig"
+
+
+class TestEventBusPublish:
+    """Tests for EventBus.publish."""
+
+    async def test_publishes_to_producers_assigned_after_construction(self):
+        """Test that replacing `producers` changes where events are published."""
+        bus = EventBus(EventConfig())
+        producer = Mock(publish=AsyncMock())
+        bus.producers = {"late": producer}
+
+        await bus.publish({"id": 1})
+        await bus.publish({"id": 2}, target="late")
+
+        assert producer.publish.await_count == 2
+        producer.publish.assert_awaited_with({"id": 2}, metadata=None)
+
+
+class TestEventBusStop:
+    """Tests for EventBus.stop."""
+
+    @pytest.fixture
+    def bus(self) -> EventBus:
+        return EventBus(EventConfig())
+
+    async def test_stop_closes_producers_after_consumers(self, bus: EventBus):
+        """Test that producers close concurrently, once every consumer has stopped."""
+        calls = []
+        all_closing = asyncio.Event()
+
+        async def stop():
+            await asyncio.sleep(0.01)
+            calls.append("consumer stopped")
+
+        async def close():
+            calls.append("producer closing")
+            if calls.count("producer closing") == 2:
+                all_closing.set()
+            await asyncio.wait_for(all_closing.wait(), timeout=1)
+
+        consumer = Mock(stop=AsyncMock(side_effect=stop))
+        producers = [Mock(close=AsyncMock(side_effect=close)) for _ in range(2)]
+        bus.consumers = {"queue": consumer}
+        bus.producers = {"a": producers[0], "b": producers[1]}
+
+        await bus.stop()
+
+        assert calls == ["consumer stopped", "producer closing", "producer closing"]
+        for producer in producers:
+            producer.close.assert_awaited_once()
+
+    async def test_stop_raises_after_closing_everything(self, bus: EventBus):
+        """Test that a failing consumer does not prevent producers from closing."""
+        consumer = Mock(stop=AsyncMock(side_effect=RuntimeError("boom")))
+        producer = Mock(close=AsyncMock())
+        bus.consumers = {"queue": consumer}
+        bus.producers = {"redis": producer}
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await bus.stop()
+
+        producer.close.assert_awaited_once()
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from midil.event.message import Message
+from midil.event.subscriber.base import FunctionSubscriber, SubscriberMiddleware
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingMiddleware(SubscriberMiddleware):
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    async def __call__(self, event, call_next):
+        self.calls.append(self.name)
+        return await call_next(event)
+
+
+class TestFunctionSubscriber:
+    """Tests for FunctionSubscriber handler resolution."""
+
+    @pytest.fixture
+    def event(self) -> Message:
+        return Message(id="1", body={"hello": "world"})
+
+    async def test_async_handler(self, event: Message):
+        """Test that an async handler is awaited directly."""
+        received = []
+
+        async def handler(e):
+            received.append(e)
+
+        await FunctionSubscriber(handler).handle(event)
+
+        assert received == [event]
+
+    async def test_sync_handler_runs_off_the_event_loop(self, event: Message):
+        """Test that a sync handler is run in the threadpool."""
+        threads = []
+
+        def handler(e):
+            threads.append(threading.current_thread())
+
+        await FunctionSubscriber(handler).handle(event)
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    async def test_sync_callable_returning_coroutine(self, event: Message):
+        """Test that an awaitable returned by a sync callable is awaited."""
+        received = []
+
+        async def handle(e):
+            received.append(e)
+
+        await FunctionSubscriber(lambda e: handle(e)).handle(event)
+
+        assert received == [event]
+
+    async def test_middlewares_wrap_sync_handler_in_order(self, event: Message):
+        """Test that middlewares run outermost-first around a sync handler."""
+        calls: list[str] = []
+
+        subscriber = FunctionSubscriber(
+            lambda e: calls.append("handler"),
+            middlewares=[
+                RecordingMiddleware("outer", calls),
+                RecordingMiddleware("inner", calls),
+            ],
+        )
+        await subscriber.handle(event)
+
+        assert calls == ["outer", "inner", "handler"]
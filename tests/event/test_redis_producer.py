@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from midil.event.exceptions import ProducerError
+from midil.event.producer.redis import RedisProducer, RedisProducerEventConfig
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakePipeline:
+    """Records queued PUBLISH commands and executions like a redis pipeline."""
+
+    def __init__(self, owner: "FakeRedis") -> None:
+        self.owner = owner
+        self.commands: list[tuple[str, bytes]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def publish(self, channel: str, message: bytes) -> None:
+        self.commands.append((channel, message))
+
+    async def execute(self) -> list[int]:
+        await asyncio.sleep(self.owner.delay)
+        if self.owner.error is not None:
+            raise self.owner.error
+        self.owner.executed.append(list(self.commands))
+        return [1] * len(self.commands)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.executed: list[list[tuple[str, bytes]]] = []
+        self.error: Exception | None = None
+        self.delay = 0.0
+        self.closed = False
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        assert transaction is False
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestRedisProducer:
+    """Tests for RedisProducer publish coalescing."""
+
+    @pytest.fixture
+    def fake_redis(self) -> FakeRedis:
+        return FakeRedis()
+
+    @pytest.fixture
+    def producer(self, fake_redis: FakeRedis) -> RedisProducer:
+        producer = RedisProducer(
+            RedisProducerEventConfig(channel="events", url="redis://localhost:6379")
+        )
+        producer.redis = fake_redis  # type: ignore[assignment]
+        return producer
+
+    async def test_single_publish(self, producer: RedisProducer, fake_redis: FakeRedis):
+        await producer.publish({"id": 1})
+
+        assert fake_redis.executed == [[("events", b'{"id":1}')]]
+        await producer.close()
+
+    async def test_concurrent_publishes_share_one_pipeline(
+        self, producer: RedisProducer, fake_redis: FakeRedis
+    ):
+        await asyncio.gather(*(producer.publish({"id": i}) for i in range(5)))
+
+        assert len(fake_redis.executed) == 1
+        assert [message for _, message in fake_redis.executed[0]] == [
+            f'{{"id":{i}}}'.encode() for i in range(5)
+        ]
+        await producer.close()
+
+    async def test_batches_respect_max_batch_size(self, fake_redis: FakeRedis):
+        producer = RedisProducer(
+            RedisProducerEventConfig(
+                channel="events", url="redis://localhost:6379", max_batch_size=2
+            )
+        )
+        producer.redis = fake_redis  # type: ignore[assignment]
+
+        await asyncio.gather(*(producer.publish({"id": i}) for i in range(5)))
+
+        assert [len(batch) for batch in fake_redis.executed] == [2, 2, 1]
+        await producer.close()
+
+    async def test_pipeline_error_is_raised_to_every_publisher(
+        self, producer: RedisProducer, fake_redis: FakeRedis
+    ):
+        fake_redis.error = ConnectionError("redis down")
+
+        results = await asyncio.gather(
+            producer.publish({"id": 1}),
+            producer.publish({"id": 2}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        await producer.close()
+
+    async def test_close_closes_connection(
+        self, producer: RedisProducer, fake_redis: FakeRedis
+    ):
+        await producer.publish({"id": 1})
+        await producer.close()
+
+        assert fake_redis.closed
+
+    async def test_close_waits_for_in_flight_flush(
+        self, producer: RedisProducer, fake_redis: FakeRedis
+    ):
+        fake_redis.delay = 0.05
+        publishes = [asyncio.create_task(producer.publish({"id": i})) for i in range(3)]
+        await asyncio.sleep(0.01)  # the flusher is now awaiting execute()
+
+        await producer.close()
+
+        assert await asyncio.gather(*publishes) == [None, None, None]
+        assert sum(len(batch) for batch in fake_redis.executed) == 3
+        assert fake_redis.closed
+
+    async def test_close_fails_pending_messages_when_backend_hangs(
+        self, producer: RedisProducer, fake_redis: FakeRedis
+    ):
+        fake_redis.delay = 10
+        producer.close_timeout = 0.05
+        in_flight = asyncio.create_task(producer.publish({"id": 1}))
+        await asyncio.sleep(0.01)  # the flusher is now stuck in execute()
+        queued = asyncio.create_task(producer.publish({"id": 2}))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(producer.close(), timeout=1)
+
+        with pytest.raises(asyncio.CancelledError):
+            await in_flight
+        with pytest.raises(ProducerError):
+            await queued
+        assert fake_redis.closed
@@ -0,0 +1,195 @@
+import asyncio
+import gc
+import threading
+import weakref
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from midil.event.scheduler.repeat import (
+    AsyncExecutionStrategy,
+    InlineExecutionStrategy,
+    PeriodicTask,
+    RedisLockManager,
+    SyncExecutionStrategy,
+    _LOCK_SCHEDULERS,
+    get_execution_strategy,
+    get_lock_scheduler,
+)
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestExecutionStrategy:
+    """Tests for selecting how a periodic task's function is run."""
+
+    async def test_strategy_selection(self):
+        """Test that sync functions only run inline when asked to."""
+
+        async def async_func():
+            ...
+
+        def sync_func():
+            ...
+
+        assert isinstance(get_execution_strategy(async_func), AsyncExecutionStrategy)
+        assert isinstance(
+            get_execution_strategy(async_func, run_sync_inline=True),
+            AsyncExecutionStrategy,
+        )
+        assert isinstance(get_execution_strategy(sync_func), SyncExecutionStrategy)
+        assert isinstance(
+            get_execution_strategy(sync_func, run_sync_inline=True),
+            InlineExecutionStrategy,
+        )
+
+    async def test_inline_task_runs_on_event_loop_thread(self):
+        """Test that an inline sync task is called without a threadpool hop."""
+        threads = []
+        task = PeriodicTask(
+            lambda: threads.append(threading.current_thread()),
+            seconds=0,
+            max_repetitions=2,
+            run_sync_inline=True,
+        )
+
+        await task._loop()
+
+        assert threads == [threading.current_thread()] * 2
+
+    async def test_sync_task_runs_in_threadpool(self):
+        """Test that sync tasks still run off the event loop by default."""
+        threads = []
+        task = PeriodicTask(
+            lambda: threads.append(threading.current_thread()),
+            seconds=0,
+            max_repetitions=1,
+        )
+
+        await task._loop()
+
+        assert threads and threads[0] is not threading.current_thread()
+
+
+class FakePipeline:
+    def __init__(self, client: MagicMock) -> None:
+        self.client = client
+        self.commands: list[dict] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def set(self, **kwargs) -> None:
+        self.commands.append(kwargs)
+
+    async def execute(self) -> list:
+        return [await self.client.set(**kwargs) for kwargs in self.commands]
+
+
+class TestRedisLockManager:
+    """Tests for the distributed lock used by repeat_every_distributed."""
+
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock()
+        client.set = AsyncMock(return_value=True)
+        client.pipeline.side_effect = lambda transaction: FakePipeline(client)
+        client.register_script.return_value = AsyncMock(return_value=1)
+        return client
+
+    async def test_acquire_uses_a_unique_token(self, client: MagicMock):
+        """Test that each acquisition stores its own random token."""
+        manager = RedisLockManager(client, "lock", ttl=10)
+
+        assert await manager.acquire()
+        assert await manager.acquire()
+
+        first, second = (call.kwargs["value"] for call in client.set.await_args_list)
+        assert first != second
+        client.set.assert_awaited_with(name="lock", value=second, nx=True, ex=10)
+
+    async def test_cached_scheduler_does_not_keep_client_alive(self):
+        """Test that a client's scheduler entry goes away with the client."""
+        client = MagicMock()
+        get_lock_scheduler(client)
+        client_ref = weakref.ref(client)
+        entries = len(_LOCK_SCHEDULERS)
+
+        del client
+        gc.collect()
+
+        assert client_ref() is None
+        assert len(_LOCK_SCHEDULERS) < entries
+
+    async def test_concurrent_acquisitions_share_a_pipeline(self, client: MagicMock):
+        """Test that tasks ticking together acquire their locks in one round trip."""
+        client.set.side_effect = [True, None, True]
+        managers = [RedisLockManager(client, f"lock-{i}", ttl=10) for i in range(3)]
+
+        results = await asyncio.gather(*(manager.acquire() for manager in managers))
+
+        assert results == [True, False, True]
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.kwargs["name"] for call in client.set.await_args_list] == [
+            "lock-0",
+            "lock-1",
+            "lock-2",
+        ]
+
+    async def test_failed_pipeline_fails_every_acquisition(self, client: MagicMock):
+        """Test that a redis error is raised to every waiting task."""
+        client.set.side_effect = ConnectionError("redis down")
+        managers = [RedisLockManager(client, f"lock-{i}", ttl=10) for i in range(2)]
+
+        results = await asyncio.gather(
+            *(manager.acquire() for manager in managers), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    async def test_extend_requires_the_lock(self, client: MagicMock):
+        """Test that a lock that was never acquired is not extended."""
+        client.set.return_value = None
+        manager = RedisLockManager(client, "lock", ttl=10)
+
+        assert not await manager.acquire()
+        assert not await manager.extend()
+        client.register_script.return_value.assert_not_awaited()
+
+    async def test_hold_renews_while_task_runs(self, client: MagicMock):
+        """Test that the lock expiry is pushed out while a long task is running."""
+        manager = RedisLockManager(client, "lock", ttl=10)
+        await manager.acquire()
+        token = client.set.await_args.kwargs["value"]
+        manager.ttl = 0.03
+
+        async with manager.hold():
+            await asyncio.sleep(0.05)
+
+        extend = client.register_script.return_value
+        assert extend.await_count >= 2
+        extend.assert_awaited_with(keys=["lock"], args=[token, 30])
+
+        calls = extend.await_count
+        await asyncio.sleep(0.03)
+        assert extend.await_count == calls
+
+    async def test_distributed_task_runs_inside_hold(self, client: MagicMock):
+        """Test that a task only runs after the lock is acquired."""
+        runs = []
+        task = PeriodicTask(
+            lambda: runs.append(1),
+            seconds=0,
+            max_repetitions=2,
+            lock_manager=RedisLockManager(client, "lock", ttl=10),
+            run_sync_inline=True,
+        )
+        client.set.side_effect = [True, None]
+
+        await task._loop()
+
+        assert runs == [1]
@@ -0,0 +1,72 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from midil.event.consumer.sqs import SQSConsumer, SQSConsumerEventConfig
+
+
+pytestmark = pytest.mark.asyncio
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/events"
+
+
+def _sqs_message(message_id: str) -> dict:
+    return {
+        "MessageId": message_id,
+        "ReceiptHandle": f"handle-{message_id}",
+        "Body": "{}",
+    }
+
+
+class TestSQSConsumerAcks:
+    """Tests for batching deletes of acked messages."""
+
+    @pytest.fixture
+    def sqs(self) -> AsyncMock:
+        sqs = AsyncMock()
+        sqs.delete_message_batch.return_value = {"Successful": [], "Failed": []}
+        return sqs
+
+    @pytest.fixture
+    def consumer(self) -> SQSConsumer:
+        consumer = SQSConsumer(SQSConsumerEventConfig(queue_url=QUEUE_URL))
+        consumer._pending_acks = []
+        return consumer
+
+    async def test_acks_are_flushed_as_handlers_complete(
+        self, consumer: SQSConsumer, sqs: AsyncMock
+    ):
+        """Test that a slow handler does not hold back the deletes of fast ones."""
+        delays = {"fast": 0.0, "slow": 0.05}
+
+        async def dispatch(event):
+            await asyncio.sleep(delays[event.id])
+            await consumer.ack(event)
+
+        consumer.dispatch = dispatch  # type: ignore[method-assign]
+
+        slow = asyncio.create_task(consumer._process_and_ack(sqs, _sqs_message("slow")))
+        await consumer._process_and_ack(sqs, _sqs_message("fast"))
+
+        sqs.delete_message_batch.assert_awaited_once_with(
+            QueueUrl=QUEUE_URL, Entries=[{"Id": "0", "ReceiptHandle": "handle-fast"}]
+        )
+        await slow
+        assert sqs.delete_message_batch.await_count == 2
+
+    async def test_flush_errors_are_logged_not_raised(
+        self, consumer: SQSConsumer, sqs: AsyncMock
+    ):
+        """Test that a failing delete does not mask the handler's own error."""
+        sqs.delete_message_batch.side_effect = RuntimeError("connection reset")
+
+        async def dispatch(event):
+            await consumer.ack(event)
+            raise ValueError("handler failed")
+
+        consumer.dispatch = dispatch  # type: ignore[method-assign]
+        consumer.nack = AsyncMock()  # type: ignore[method-assign]
+
+        with pytest.raises(ValueError, match="handler failed"):
+            await consumer._process_and_ack(sqs, _sqs_message("1"))
@@ -0,0 +1,153 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncio
+
+import pytest
+
+from midil.event.exceptions import ProducerError
+from midil.event.producer import sqs as sqs_module
+from midil.event.producer.sqs import SQSProducer, SQSProducerEventConfig
+
+
+pytestmark = pytest.mark.asyncio
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/events"
+
+
+class TestSQSProducer:
+    """Tests for SQSProducer client reuse and batching."""
+
+    @pytest.fixture
+    def sqs_client(self) -> AsyncMock:
+        sqs_client = AsyncMock()
+        sqs_client.send_message_batch.return_value = {"Successful": [], "Failed": []}
+        return sqs_client
+
+    @pytest.fixture
+    def client_cm(self, sqs_client: AsyncMock) -> MagicMock:
+        client_cm = MagicMock()
+        client_cm.__aenter__ = AsyncMock(return_value=sqs_client)
+        client_cm.__aexit__ = AsyncMock(return_value=None)
+        return client_cm
+
+    @pytest.fixture
+    def producer(self, client_cm: MagicMock) -> SQSProducer:
+        producer = SQSProducer(SQSProducerEventConfig(queue_url=QUEUE_URL))
+        producer.session = MagicMock()
+        producer.session.client.return_value = client_cm
+        return producer
+
+    async def test_client_is_created_once(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that repeated publishes share one SQS client."""
+        await producer.publish({"id": 1})
+        await producer.publish({"id": 2})
+
+        producer.session.client.assert_called_once_with("sqs", region_name="us-east-1")
+        assert sqs_client.send_message_batch.await_count == 2
+        sqs_client.send_message_batch.assert_awaited_with(
+            QueueUrl=QUEUE_URL, Entries=[{"Id": "0", "MessageBody": '{"id":2}'}]
+        )
+
+    async def test_close_releases_client(
+        self, producer: SQSProducer, client_cm: MagicMock
+    ):
+        """Test that close exits the client context and allows a new one."""
+        await producer.publish({"id": 1})
+        await producer.close()
+
+        client_cm.__aexit__.assert_awaited_once_with(None, None, None)
+
+        await producer.publish({"id": 2})
+        assert producer.session.client.call_count == 2
+
+    async def test_close_without_publish_is_noop(self, producer: SQSProducer):
+        """Test that close does nothing if no client was opened."""
+        await producer.close()
+
+        producer.session.client.assert_not_called()
+
+    async def test_close_waits_for_in_flight_batch(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that close lets a batch being sent finish instead of cancelling it."""
+
+        async def slow_send(**kwargs):
+            await asyncio.sleep(0.05)
+            return {"Successful": [], "Failed": []}
+
+        sqs_client.send_message_batch.side_effect = slow_send
+        publishes = [asyncio.create_task(producer.publish({"id": i})) for i in range(3)]
+        await asyncio.sleep(0.01)  # the flusher is now awaiting the send
+
+        await producer.close()
+
+        assert await asyncio.gather(*publishes) == [None, None, None]
+        sqs_client.send_message_batch.assert_awaited_once()
+
+    async def test_concurrent_publishes_share_one_batch(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that concurrent publishes are sent with one SendMessageBatch."""
+        await asyncio.gather(*(producer.publish({"id": i}) for i in range(3)))
+
+        sqs_client.send_message_batch.assert_awaited_once_with(
+            QueueUrl=QUEUE_URL,
+            Entries=[{"Id": str(i), "MessageBody": f'{{"id":{i}}}'} for i in range(3)],
+        )
+        sqs_client.send_message.assert_not_called()
+
+    async def test_batches_are_capped_at_ten_entries(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that no batch exceeds the SQS entry limit."""
+        await asyncio.gather(*(producer.publish({"id": i}) for i in range(25)))
+
+        sizes = [
+            len(call.kwargs["Entries"])
+            for call in sqs_client.send_message_batch.await_args_list
+        ]
+        assert sizes == [10, 10, 5]
+
+    async def test_batches_are_split_by_size(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that a batch over the request size limit is split."""
+        body = "x" * (100 * 1024)
+        await asyncio.gather(*(producer.publish(body) for _ in range(3)))
+
+        sizes = [
+            len(call.kwargs["Entries"])
+            for call in sqs_client.send_message_batch.await_args_list
+        ]
+        assert sizes == [2, 1]
+
+    async def test_failed_entry_raises_for_its_publisher_only(
+        self, producer: SQSProducer, sqs_client: AsyncMock
+    ):
+        """Test that a failed batch entry fails only the matching publish."""
+        sqs_client.send_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Code": "InternalError", "Message": "boom"}],
+        }
+
+        results = await asyncio.gather(
+            producer.publish({"id": 0}),
+            producer.publish({"id": 1}),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], ProducerError)
+        assert "InternalError" in str(results[1])
+
+    async def test_producers_share_one_session(self, monkeypatch):
+        """Test that all producers reuse a single aioboto3 session."""
+        monkeypatch.setattr(sqs_module, "_session", None)
+        with patch.object(sqs_module.aioboto3, "Session") as session_cls:
+            first = SQSProducer(SQSProducerEventConfig(queue_url=QUEUE_URL))
+            second = SQSProducer(SQSProducerEventConfig(queue_url=QUEUE_URL))
+
+        session_cls.assert_called_once_with()
+        assert first.session is second.session
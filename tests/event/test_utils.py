@@ -0,0 +1,35 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from midil.event.utils import dumps_message
+
+
+class TestDumpsMessage:
+    """Tests for dumps_message."""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"event": "created", "id": 1, "name": "é"},
+            {1: "a", 2: "b"},
+            {"n": 2**70},
+            [1.5, None, True],
+        ],
+    )
+    def test_matches_stdlib_json(self, payload):
+        """Test that payloads encode the same as compact json.dumps."""
+        expected = json.dumps(
+            payload, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+        assert dumps_message(payload) == expected
+        with patch("midil.event.utils.orjson", None):
+            assert dumps_message(payload) == expected
+
+    def test_rejects_datetime_like_stdlib_json(self):
+        """Test that values json.dumps rejects are still rejected."""
+        with pytest.raises(TypeError):
+            dumps_message({"at": datetime.now(timezone.utc)})
@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from midil.http_client.client import HttpClient
+from midil.http_client.overrides import async_http
+from midil.http_client.overrides.async_http import get_http_async_client
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestGetHttpAsyncClient:
+    """Tests for the shared async HTTP client cache."""
+
+    async def test_same_options_share_a_client_across_tasks(self):
+        """Test that tasks asking for the same options get the same client."""
+        first, second = await asyncio.gather(
+            asyncio.create_task(self._get("https://example.com")),
+            asyncio.create_task(self._get("https://example.com")),
+        )
+
+        assert first is second
+        assert first is get_http_async_client(base_url="https://example.com")
+
+    async def test_different_options_get_different_clients(self):
+        """Test that interleaved callers with different options don't evict each other."""
+        a = get_http_async_client(base_url="https://a.example.com")
+        b = get_http_async_client(base_url="https://b.example.com")
+
+        assert a is not b
+        assert get_http_async_client(base_url="https://a.example.com") is a
+
+    async def test_closed_client_is_replaced(self):
+        """Test that a closed client is not handed out again."""
+        client = get_http_async_client(base_url="https://closed.example.com")
+        await client.aclose()
+
+        assert (
+            get_http_async_client(base_url="https://closed.example.com") is not client
+        )
+
+    async def test_object_options_are_not_cached(self):
+        """Test that options such as auth objects always get a fresh client."""
+        auth = httpx.BasicAuth("user", "secret")
+
+        first = get_http_async_client(auth=auth)
+        second = get_http_async_client(auth=auth)
+
+        assert first is not second
+        await asyncio.gather(first.aclose(), second.aclose())
+
+    async def test_evicted_clients_are_left_open(self):
+        """Test that the cache is bounded without closing clients still in use."""
+        with patch.object(async_http, "_MAX_CLIENTS_PER_LOOP", 2):
+            oldest = get_http_async_client(base_url="https://evict-0.example.com")
+            get_http_async_client(base_url="https://evict-1.example.com")
+            get_http_async_client(base_url="https://evict-2.example.com")
+            await asyncio.sleep(0)
+
+        assert not oldest.is_closed
+        assert get_http_async_client(base_url="https://evict-0.example.com") is not (
+            oldest
+        )
+        await oldest.aclose()
+
+    async def test_http_clients_share_a_pooled_client(self):
+        """Test that HttpClient instances for the same base URL share a client."""
+        first = HttpClient("https://pooled.example.com")
+        second = HttpClient(httpx.URL("https://pooled.example.com"))
+
+        assert first.client is second.client
+
+    async def test_clients_outside_a_loop_are_not_shared(self):
+        """Test that without a running loop every call builds its own client."""
+        first, second = await asyncio.to_thread(
+            lambda: (get_http_async_client(), get_http_async_client())
+        )
+
+        assert first is not second
+
+    @staticmethod
+    async def _get(base_url: str):
+        return get_http_async_client(base_url=base_url)
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import Mock
+import httpx
+
+from midil.http_client.overrides.retry.transport import RetryTransport
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestRetryTransport:
+    """Tests for RetryTransport."""
+
+    @pytest.fixture
+    def backoff(self) -> Mock:
+        """Create a backoff strategy that never sleeps."""
+        backoff = Mock()
+        backoff.calculate_sleep.return_value = 0.0
+        return backoff
+
+    async def test_final_retryable_response_is_returned_readable(self, backoff):
+        """Test that the last attempt's response is returned unclosed and without a trailing backoff."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503, json={"attempt": len(calls)})
+
+        transport = RetryTransport(
+            httpx.MockTransport(handler), max_attempts=3, backoff_strategy=backoff
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("http://test/")
+
+        assert response.status_code == 503
+        assert response.json() == {"attempt": 3}
+        assert len(calls) == 3
+        assert backoff.calculate_sleep.call_count == 2
+
+    async def test_final_retryable_error_is_raised(self, backoff):
+        """Test that an error on the last attempt is raised instead of returning None."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        transport = RetryTransport(
+            httpx.MockTransport(handler), max_attempts=2, backoff_strategy=backoff
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://test/")
+
+        assert backoff.calculate_sleep.call_count == 1
@@ -0,0 +1,72 @@
+from pydantic import BaseModel
+
+from midil.jsonapi import Document, Links, RelationshipObject, ResourceObject
+from midil.jsonapi.document import ResourceIdentifierObject
+
+
+class UserAttributes(BaseModel):
+    name: str
+    email: str
+
+
+USER_DOCUMENT = {
+    "data": [
+        {
+            "type": "users",
+            "id": "1",
+            "attributes": {"name": "John Doe", "email": "john@example.com"},
+            "links": {"self": "https://api.example.com/users/1"},
+            "relationships": {"org": {"data": {"type": "orgs", "id": "2"}}},
+        }
+    ],
+    "meta": {"total": 1},
+}
+
+
+def test_construct_trusted_builds_nested_models():
+    document = Document[UserAttributes].construct_trusted(**USER_DOCUMENT)
+
+    resource = document.data[0]
+    assert isinstance(resource, ResourceObject)
+    assert resource.attributes == UserAttributes(
+        name="John Doe", email="john@example.com"
+    )
+    assert isinstance(resource.links, Links)
+    assert resource.links.self == "https://api.example.com/users/1"
+    relationship = resource.relationships["org"]
+    assert isinstance(relationship, RelationshipObject)
+    assert isinstance(relationship.data, ResourceIdentifierObject)
+    assert document.meta == {"total": 1}
+
+
+def test_construct_trusted_matches_validated_output():
+    trusted = Document[UserAttributes].construct_trusted(**USER_DOCUMENT)
+    validated = Document[UserAttributes](**USER_DOCUMENT)
+
+    assert trusted.model_dump() == validated.model_dump()
+
+
+def test_construct_trusted_fills_defaults():
+    document = Document[UserAttributes].construct_trusted(**USER_DOCUMENT)
+
+    assert document.jsonapi is not None
+    assert document.jsonapi.version == "1.1"
+    assert document.included is None
+
+
+def test_construct_trusted_skips_validation():
+    resource = ResourceObject[UserAttributes].construct_trusted(
+        type="users", id="not a valid id"
+    )
+
+    assert resource.id == "not a valid id"
+
+
+def test_construct_trusted_keeps_model_instances():
+    attributes = UserAttributes(name="Jane", email="jane@example.com")
+
+    resource = ResourceObject[UserAttributes].construct_trusted(
+        type="users", id="1", attributes=attributes
+    )
+
+    assert resource.attributes is attributes
@@ -1,6 +1,11 @@
+import json
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
+
 from pydantic import BaseModel
 
+from midil.jsonapi import Document, ResourceObject
+
 from midil.jsonapi._mixins.serializers import (
     ResourceSerializerMixin,
     ErrorSerializerMixin,
@@ -142,3 +147,33 @@ def test_document_to_jsonapi_with_included_resources():
     doc = DocumentStub(data=None, included=[included_res])
     result = doc.to_jsonapi()
     assert result["included"][0]["id"] == "42"
+
+
+class DatedAttributes(BaseModel):
+    title: str
+    published_at: datetime
+    summary: Optional[str] = None
+
+
+def _dated_document() -> Document[DatedAttributes]:
+    return Document[DatedAttributes](
+        data=[
+            ResourceObject[DatedAttributes](
+                id=str(i),
+                type="articles",
+                attributes=DatedAttributes(
+                    title="Héllo",
+                    published_at=datetime(2024, 1, i, tzinfo=timezone.utc),
+                ),
+            )
+            for i in range(1, 4)
+        ],
+        meta={"total": 3},
+    )
+
+
+def test_document_to_json_matches_model_dump_json():
+    doc = _dated_document()
+    assert json.loads(doc.to_json()) == json.loads(
+        doc.model_dump_json(exclude_none=True)
+    )
@@ -1,4 +1,6 @@
 # tests/test_jsonapi_models.py
+import gc
+
 import pytest
 from pydantic import ValidationError, HttpUrl
 from midil.jsonapi.document import (
@@ -18,8 +20,10 @@ from midil.jsonapi.document import (
     PatchDocument,
     PatchMultiDocument,
     PostMultiDocument,
+    warmup_jsonapi,
     _ResourceBase,
     JSONAPI_CONTENT_TYPE,
+    JSONAPI_DEFAULT_HEADERS,
 )
 from pydantic import BaseModel
 
@@ -94,6 +98,22 @@ def test_error_document_with_multiple_errors():
     assert err_doc.jsonapi.version == "1.1"  # type: ignore
 
 
+def test_documents_share_the_default_jsonapi_object():
+    first = ErrorDocument(errors=[ErrorObject(status="400")])
+    second = ErrorDocument(errors=[ErrorObject(status="404")])
+
+    assert first.jsonapi is second.jsonapi
+    with pytest.raises(ValidationError):
+        first.jsonapi.version = "2.0"  # type: ignore
+
+
+def test_default_headers_are_read_only():
+    assert JSONAPI_DEFAULT_HEADERS["content-type"] == JSONAPI_CONTENT_TYPE
+    assert JSONAPI_DEFAULT_HEADERS["jsonapi-version"] == Header().version
+    with pytest.raises(TypeError):
+        JSONAPI_DEFAULT_HEADERS["accept"] = "text/html"  # type: ignore
+
+
 def test_header_defaults_and_custom():
     h = Header()
     assert h.accept == JSONAPI_CONTENT_TYPE
@@ -140,3 +160,16 @@ def test_forbid_extra_fields():
 def test_allow_extra_fields():
     obj = JSONAPIObject(extra_field="ok")  # type: ignore
     assert obj.extra_field == "ok"  # type: ignore
+
+
+def test_warmup_jsonapi_keeps_parametrized_models():
+    class WarmAttributes(BaseModel):
+        name: str
+
+    warmup_jsonapi([WarmAttributes])
+    warmed = Document[WarmAttributes]
+    gc.collect()
+
+    assert Document[WarmAttributes] is warmed
+    assert warmed.__pydantic_complete__
+    assert PostDocument[WarmAttributes].__pydantic_complete__
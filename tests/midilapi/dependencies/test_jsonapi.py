@@ -0,0 +1,53 @@
+import pytest
+from pydantic import ValidationError
+
+from midil.jsonapi.query import SortDirection
+from midil.midilapi.dependencies.jsonapi import parse_include, parse_sort
+
+
+class TestParseSort:
+    """Tests for the parse_sort dependency."""
+
+    def test_parses_directions(self):
+        """Test that a leading '-' sorts descending."""
+        sort = parse_sort(["-created_at", "name"])
+
+        assert [(f.field, f.direction) for f in sort.fields] == [
+            ("created_at", SortDirection.DESC),
+            ("name", SortDirection.ASC),
+        ]
+
+    def test_repeated_query_reuses_result(self):
+        """Test that the same sort values return the cached instance."""
+        assert parse_sort(["-created_at", "name"]) is parse_sort(
+            ["-created_at", "name"]
+        )
+        assert parse_sort(["name", "-created_at"]) is not parse_sort(
+            ["-created_at", "name"]
+        )
+
+    def test_missing_sort(self):
+        """Test that no sort values yields None."""
+        assert parse_sort(None) is None
+        assert parse_sort([]) is None
+
+    def test_invalid_field_still_raises(self):
+        """Test that invalid fields are rejected on every call."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                parse_sort(["1bad"])
+
+
+class TestParseInclude:
+    """Tests for the parse_include dependency."""
+
+    def test_repeated_query_reuses_result(self):
+        """Test that the same include values return the cached instance."""
+        include = parse_include(["author", "comments.author"])
+
+        assert include.relationships == ["author", "comments.author"]
+        assert parse_include(["author", "comments.author"]) is include
+
+    def test_missing_include(self):
+        """Test that no include values yields None."""
+        assert parse_include(None) is None
@@ -1,10 +1,8 @@
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from starlette.requests import Request
-from starlette.responses import Response
 from starlette.applications import Starlette
 from starlette.exceptions import HTTPException
-from typing import Callable, Awaitable
 
 from midil.midilapi.middleware.auth_middleware import (
     AuthContext,
@@ -45,6 +43,20 @@ class TestAuthContext:
         assert result["raw_headers"] == raw_headers
         assert isinstance(result["claims"], dict)
 
+    def test_auth_context_copies_headers_lazily(self, mock_cognito_claims) -> None:
+        """Test that request headers are copied once, on first read."""
+        claims = AuthZTokenClaims(token="Bearer test-token", **mock_cognito_claims)
+        headers = MagicMock()
+        headers.keys.return_value = ["authorization"]
+        headers.__getitem__.return_value = "Bearer token"
+
+        context = AuthContext(claims=claims, _raw_headers=headers)
+        headers.keys.assert_not_called()
+
+        assert context.to_dict()["raw_headers"] == {"authorization": "Bearer token"}
+        assert context._raw_headers is context._raw_headers
+        headers.keys.assert_called_once_with()
+
 
 class TestCognitoAuthMiddleware:
     """Tests for CognitoAuthMiddleware class."""
@@ -54,18 +66,10 @@ class TestCognitoAuthMiddleware:
         """Create a mock request."""
         request = Mock(spec=Request)
         request.headers = {"authorization": "Bearer test-token"}
+        request.scope = {"headers": [(b"authorization", b"Bearer test-token")]}
         request.state = Mock()
         return request
 
-    @pytest.fixture
-    def mock_call_next(self) -> Callable[[Request], Awaitable[Response]]:
-        """Create a mock call_next function."""
-
-        async def call_next(request: Request) -> Response:
-            return Response("OK")
-
-        return call_next
-
     @pytest.fixture
     def auth_middleware(self) -> CognitoAuthMiddleware:
         """Create CognitoAuthMiddleware instance."""
@@ -88,26 +92,24 @@ class TestCognitoAuthMiddleware:
         },
     )
     @patch("midil.midilapi.middleware.auth_middleware.CognitoJWTAuthorizer")
-    async def test_dispatch_success(
+    async def test_authenticate_success(
         self,
         mock_authorizer_class,
         auth_middleware,
         mock_request,
-        mock_call_next,
         mock_authorizer,
         mock_cognito_claims,
     ) -> None:
-        """Test successful authentication in middleware dispatch."""
+        """Test successful authentication of a request."""
         # Setup mocks
         mock_authorizer_class.return_value = mock_authorizer
         claims = AuthZTokenClaims(token="Bearer test-token", **mock_cognito_claims)
         mock_authorizer.verify.return_value = claims
 
         # Execute
-        response = await auth_middleware.dispatch(mock_request, mock_call_next)
+        await auth_middleware.authenticate(mock_request)
 
         # Verify
-        assert response.status_code == 200
         mock_authorizer.verify.assert_called_once_with("test-token")
 
         # Check that auth context was set on request state
@@ -125,8 +127,8 @@ class TestCognitoAuthMiddleware:
     )
     @pytest.mark.anyio
     @patch("midil.midilapi.middleware.auth_middleware.CognitoJWTAuthorizer")
-    async def test_dispatch_authorization_error(
-        self, mock_authorizer_class, auth_middleware, mock_request, mock_call_next
+    async def test_authenticate_authorization_error(
+        self, mock_authorizer_class, auth_middleware, mock_request
     ) -> None:
         """Test middleware behavior when authorization fails."""
         # Setup mock to raise exception
@@ -136,7 +138,7 @@ class TestCognitoAuthMiddleware:
 
         # Execute and verify exception is raised
         with pytest.raises(Exception, match="Invalid token"):
-            await auth_middleware.dispatch(mock_request, mock_call_next)
+            await auth_middleware.authenticate(mock_request)
 
         mock_authorizer.verify.assert_called_once_with("test-token")
 
@@ -148,12 +150,11 @@ class TestCognitoAuthMiddleware:
         },
     )
     @patch("midil.midilapi.middleware.auth_middleware.CognitoJWTAuthorizer")
-    async def test_dispatch_empty_environment(
+    async def test_authenticate_empty_environment(
         self,
         mock_authorizer_class,
         auth_middleware,
         mock_request,
-        mock_call_next,
         mock_authorizer,
         mock_cognito_claims,
     ) -> None:
@@ -164,26 +165,112 @@ class TestCognitoAuthMiddleware:
         mock_authorizer.verify.return_value = claims
 
         # Execute
-        response = await auth_middleware.dispatch(mock_request, mock_call_next)
+        await auth_middleware.authenticate(mock_request)
 
         # Verify
-        assert response.status_code == 200
         mock_authorizer_class.assert_called_once_with(
             user_pool_id="test-pool-id", region="us-east-1"
         )
 
     @pytest.mark.anyio
-    async def test_missing_authorization_header(
-        self, auth_middleware, mock_call_next
-    ) -> None:
+    async def test_missing_authorization_header(self, auth_middleware) -> None:
         """Test middleware behavior when authorization header is missing."""
         request = Mock(spec=Request)
         request.headers = {}  # No authorization header
+        request.scope = {"headers": [(b"accept", b"application/json")]}
         request.state = Mock()
 
         # The middleware should raise HTTPException with status 401 when authorization header is missing
         with pytest.raises(HTTPException) as exc_info:
-            await auth_middleware.dispatch(request, mock_call_next)
+            await auth_middleware.authenticate(request)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Authorization header is missing"
+
+    @pytest.mark.anyio
+    @patch.dict(
+        "os.environ",
+        {
+            "MIDIL__AUTH": '{"type": "cognito", "user_pool_id": "test-pool-id", "region": "us-east-1", "client_id": "test-client-id"}',
+        },
+    )
+    @patch("midil.midilapi.middleware.auth_middleware.CognitoJWTAuthorizer")
+    async def test_authorizer_is_reused_across_requests(
+        self,
+        mock_authorizer_class,
+        auth_middleware,
+        mock_request,
+        mock_authorizer,
+    ) -> None:
+        """Test that the authorizer is built once and reused for later requests."""
+        mock_authorizer_class.return_value = mock_authorizer
+
+        await auth_middleware.authenticate(mock_request)
+        await auth_middleware.authenticate(mock_request)
+
+        mock_authorizer_class.assert_called_once()
+        assert mock_authorizer.verify.call_count == 2
+
+
+class TestAuthMiddlewareASGI:
+    """Tests for the ASGI behaviour of the auth middleware."""
+
+    @pytest.fixture
+    def app(self) -> AsyncMock:
+        """Create a downstream ASGI app."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def middleware(self, app, mock_cognito_claims) -> CognitoAuthMiddleware:
+        """Create a middleware with a stubbed authorizer."""
+        middleware = CognitoAuthMiddleware(app)
+        authorizer = AsyncMock()
+        authorizer.verify.return_value = AuthZTokenClaims(
+            token="Bearer test-token", **mock_cognito_claims
+        )
+        middleware._authorizer = authorizer
+        return middleware
+
+    @staticmethod
+    def http_scope(headers: list[tuple[bytes, bytes]]) -> dict:
+        return {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": headers,
+            "query_string": b"",
+        }
+
+    @pytest.mark.anyio
+    async def test_non_http_scope_is_passed_through(self, middleware, app) -> None:
+        """Test that lifespan and websocket scopes skip authentication."""
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        app.assert_awaited_once_with(scope, receive, send)
+        middleware._authorizer.verify.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_authenticated_request_reaches_app(self, middleware, app) -> None:
+        """Test that the auth context is visible to the downstream app."""
+        scope = self.http_scope([(b"authorization", b"Bearer test-token")])
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        app.assert_awaited_once()
+        assert isinstance(scope["state"]["auth"], AuthContext)
+        middleware._authorizer.verify.assert_called_once_with("test-token")
+
+    @pytest.mark.anyio
+    async def test_missing_header_returns_401(self, middleware, app) -> None:
+        """Test that a request without credentials is answered with 401."""
+        send = AsyncMock()
+
+        await middleware(self.http_scope([]), AsyncMock(), send)
+
+        app.assert_not_called()
+        start = send.await_args_list[0].args[0]
+        assert start["type"] == "http.response.start"
+        assert start["status"] == 401
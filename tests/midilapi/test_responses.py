@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from midil.jsonapi import Document, ErrorDocument, ResourceObject
+from midil.jsonapi.document import JSONAPI_CONTENT_TYPE, ErrorObject
+from midil.midilapi.responses import JSONAPIResponse
+
+
+class Article(BaseModel):
+    title: str
+    published_at: datetime
+    summary: str | None = None
+
+
+class TestJSONAPIResponse:
+    """Tests for JSONAPIResponse rendering."""
+
+    def test_renders_document(self):
+        """Test that the body matches the document dump without None values."""
+        document = Document[Article](
+            data=ResourceObject[Article](
+                id="1",
+                type="articles",
+                attributes=Article(
+                    title="Héllo",
+                    published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                ),
+            )
+        )
+
+        response = JSONAPIResponse(document, status_code=201)
+
+        assert response.status_code == 201
+        assert response.media_type == JSONAPI_CONTENT_TYPE
+        assert json.loads(response.body) == document.model_dump(
+            mode="json", exclude_none=True
+        )
+        assert "summary" not in json.loads(response.body)["data"]["attributes"]
+
+    def test_renders_error_document(self):
+        """Test that error documents are rendered the same way."""
+        document = ErrorDocument(errors=[ErrorObject(status="400", title="Bad")])
+
+        response = JSONAPIResponse(document, status_code=400)
+
+        assert json.loads(response.body) == {
+            "errors": [{"status": "400", "title": "Bad"}],
+            "jsonapi": {"version": "1.1"},
+        }
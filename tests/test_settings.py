@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from midil.midilapi.config import MidilApiConfig
+from midil.settings import ApiSettings, clear_settings_cache, get_api_settings
+
+
+class TestSettingsModels:
+    """Tests for the settings models."""
+
+    def test_validate_and_schema(self):
+        """Test that the settings models validate and build a schema directly."""
+        code = (
+            "from midil.settings import MidilSettings; "
+            "MidilSettings.model_validate({}); MidilSettings.model_json_schema()"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_api_settings_default(self):
+        """Test that ApiSettings defaults to the standard API config."""
+        assert isinstance(ApiSettings().api, MidilApiConfig)
+
+    def test_loads_api_settings_from_env(self, monkeypatch):
+        """Test that MidilSettings reads nested configs from the environment."""
+        monkeypatch.setenv("MIDIL__API__SERVER__PORT", "9001")
+        clear_settings_cache()
+        try:
+            assert get_api_settings().server.port == 9001
+        finally:
+            clear_settings_cache()
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+import anyio.to_thread
+import pytest
+
+from midil.utils.concurrency import configure_thread_pool
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestConfigureThreadPool:
+    """Tests for configure_thread_pool."""
+
+    async def test_explicit_size(self):
+        """Test that both the anyio limiter and the default executor are resized."""
+        assert configure_thread_pool(8) == 8
+
+        assert anyio.to_thread.current_default_thread_limiter().total_tokens == 8
+        name = await asyncio.to_thread(lambda: threading.current_thread().name)
+        assert name.startswith("midil")
+
+    async def test_size_from_environment(self, monkeypatch):
+        """Test that the size defaults to MIDIL__THREAD_POOL_SIZE."""
+        monkeypatch.setenv("MIDIL__THREAD_POOL_SIZE", "12")
+
+        assert configure_thread_pool() == 12
+        assert anyio.to_thread.current_default_thread_limiter().total_tokens == 12
+
+    async def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            configure_thread_pool(0)
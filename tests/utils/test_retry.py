@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from tenacity import wait_none
+
+from midil.utils import retry as retry_module
+from midil.utils.retry import AsyncRetry, _exponential_jitter_delay
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAsyncRetry:
+    """Tests for AsyncRetry."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch.object(retry_module.asyncio, "sleep", AsyncMock()) as sleep:
+            yield sleep
+
+    async def test_first_attempt_success(self):
+        """Test that a successful call runs once and is logged."""
+        func = AsyncMock(return_value="ok", __name__="func")
+
+        with patch.object(retry_module.logger, "debug") as debug:
+            assert await AsyncRetry()(func, 1, key="value") == "ok"
+
+        func.assert_awaited_once_with(1, key="value")
+        debug.assert_called_once()
+        assert debug.call_args.args[0].startswith("Attempt 1:")
+
+    async def test_retries_then_reraises(self, no_sleep: AsyncMock):
+        """Test that the last error is re-raised after max_attempts."""
+        func = AsyncMock(side_effect=ConnectionError("down"), __name__="func")
+
+        with pytest.raises(ConnectionError, match="down"):
+            await AsyncRetry(max_attempts=3)(func)
+
+        assert func.await_count == 3
+        assert no_sleep.await_count == 2
+
+    async def test_other_errors_are_not_retried(self):
+        """Test that exceptions outside retry_on_exceptions propagate at once."""
+        func = AsyncMock(side_effect=KeyError("missing"), __name__="func")
+
+        with pytest.raises(KeyError):
+            await AsyncRetry(retry_on_exceptions=(ConnectionError,))(func)
+
+        func.assert_awaited_once()
+
+    async def test_custom_wait_strategy(self):
+        """Test that a tenacity wait strategy is still honoured."""
+        func = AsyncMock(side_effect=[ConnectionError(), "ok"], __name__="func")
+
+        assert await AsyncRetry(wait=wait_none())(func) == "ok"
+        assert func.await_count == 2
+
+    async def test_exponential_jitter_delay(self):
+        """Test that the default delay doubles per attempt and is capped."""
+        assert 1 <= _exponential_jitter_delay(1) <= 2
+        assert 4 <= _exponential_jitter_delay(3) <= 5
+        assert _exponential_jitter_delay(100) == 60